@@ -1,11 +1,22 @@
 import math
 
+
+def aire_cercle(r, _pi=math.pi):
+    """Aire d'un disque : π·r·r (π lié en argument par défaut, r*r plutôt que r**2)."""
+    return _pi * r * r
+
+
+def aires_cercles(rayons, _pi=math.pi):
+    """Aires d'une série de rayons, calculées en une seule compréhension."""
+    return [_pi * r * r for r in rayons]
+
+
 rayon = 5.0  # Valeur d'exemple, peut être remplacée par input()
 
 if rayon <= 0:
     print("Erreur: Le rayon doit être un nombre positif.")
 else:
-    aire = math.pi * (rayon ** 2)
+    aire = aire_cercle(rayon)
     aire_arrondie = round(aire, 2)
     print(f"Le rayon du cercle est: {rayon}")
     print(f"L'aire du cercle est: {aire_arrondie}")
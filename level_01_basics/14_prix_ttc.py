@@ -1,5 +1,6 @@
 prix_ht = 100.0
 taux_tva_decimal = 0.20  # 20% de TVA
+taux_tva_pourcent = taux_tva_decimal * 100  # Calculé une fois, pour l'affichage
 
 if prix_ht < 0 or taux_tva_decimal < 0:
     print("Erreur: Le prix HT et le taux de TVA doivent être positifs.")
@@ -9,7 +10,7 @@ else:
 
     # Affichage formaté
     print(f"Prix HT: {prix_ht:.2f}")
-    print(f"Taux TVA: {taux_tva_decimal*100:.2f}%")
+    print(f"Taux TVA: {taux_tva_pourcent:.2f}%")
     print(f"Montant TVA: {montant_tva:.2f}")
     print(f"Prix TTC: {prix_ttc:.2f}")
 
@@ -1,19 +1,25 @@
+import sys
+
+lignes = []  # Sorties regroupées, écrites en une seule fois à la fin
+
 compteur = 1
 
-print("Début de la boucle while:")
+lignes.append("Début de la boucle while:")
 while compteur <= 5:
-    print(f"Compteur: {compteur}")
+    lignes.append(f"Compteur: {compteur}")
     compteur += 1  # Incrémentation du compteur
 
-print("Fin de la boucle.")
+lignes.append("Fin de la boucle.")
 
 # Exemple de boucle while avec condition de sortie anticipée (break)
-print("\nAutre exemple de boucle while avec un break:")
+lignes.append("\nAutre exemple de boucle while avec un break:")
 compteur_break = 0
 while True: # Boucle potentiellement infinie
     compteur_break +=1
-    print(f"Compteur (break example): {compteur_break}")
+    lignes.append(f"Compteur (break example): {compteur_break}")
     if compteur_break >= 3:
-        print("Condition de sortie atteinte (break).")
+        lignes.append("Condition de sortie atteinte (break).")
         break
-print("Sortie de la boucle à break.") 
\ No newline at end of file
+lignes.append("Sortie de la boucle à break.") 
+
+sys.stdout.write("\n".join(lignes) + "\n")
@@ -1,3 +1,11 @@
+def _est_bissextile(annee):
+    """Prédicat arithmétique pur (sans validation ni formatage)."""
+    return (annee % 4 == 0 and annee % 100 != 0) or (annee % 400 == 0)
+
+def annees_bissextiles(annees):
+    """Retourne la liste des booléens « bissextile » pour une séquence d'années."""
+    return [_est_bissextile(annee) for annee in annees]
+
 def est_annee_bissextile(annee):
     """
     Vérifie si une année est bissextile.
@@ -7,7 +15,7 @@ def est_annee_bissextile(annee):
     if not isinstance(annee, int) or annee <= 0:
         return "Veuillez entrer un entier positif pour l'année."
     
-    if (annee % 4 == 0 and annee % 100 != 0) or (annee % 400 == 0):
+    if _est_bissextile(annee):
         return f"{annee} est une année bissextile."
     else:
         return f"{annee} n'est pas une année bissextile."
@@ -24,6 +32,10 @@ if __name__ == "__main__":
     print(est_annee_bissextile(0))      # Entrée invalide
     print(est_annee_bissextile(-5))     # Entrée invalide
     print(est_annee_bissextile("abc"))  # Entrée invalide
+
+    # Classification d'un siècle entier en un seul appel
+    siecle = range(2000, 2100)
+    print(f"Années bissextiles entre 2000 et 2099 : {sum(annees_bissextiles(siecle))}")
     
     # Demander à l'utilisateur de saisir une année
     # try:
@@ -1,11 +1,12 @@
+import sys
+
 nombre_str = "5" # Simule une saisie
 
 try:
     nombre = int(nombre_str)
-    print(f"Table de multiplication pour {nombre}:")
-    for i in range(1, 11): # De 1 à 10 inclus
-        resultat = nombre * i
-        print(f"{nombre} x {i} = {resultat}")
+    prefixe = f"{nombre} x " # Partie constante, formatée une seule fois
+    lignes = [f"{prefixe}{i} = {nombre * i}" for i in range(1, 11)] # De 1 à 10 inclus
+    sys.stdout.write(f"Table de multiplication pour {nombre}:\n" + "\n".join(lignes) + "\n") # Une seule écriture
 except ValueError:
     print(f"Erreur: '{nombre_str}' n'est pas un nombre entier valide.")
 
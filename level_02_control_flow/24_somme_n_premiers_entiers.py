@@ -1,4 +1,5 @@
 n_str = "10" # Simule une saisie
+AFFICHER_BOUCLE = False # Passer à True pour voir la version pédagogique avec boucle
 
 try:
     n = int(n_str)
@@ -7,14 +8,16 @@ try:
     elif n == 0:
         print("La somme des 0 premiers entiers est 0.")
     else:
-        somme = 0
-        for i in range(1, n + 1):
-            somme += i
+        # Formule de Gauss : O(1) au lieu d'une boucle O(n)
+        somme = n * (n + 1) // 2
         print(f"La somme des {n} premiers entiers est {somme}.")
 
-        # Alternative avec la formule mathématique
-        somme_formule = n * (n + 1) // 2
-        print(f"(Vérification par formule: {somme_formule})")
+        if AFFICHER_BOUCLE:
+            # Version avec boucle, conservée pour l'exemple
+            somme_boucle = 0
+            for i in range(1, n + 1):
+                somme_boucle += i
+            print(f"(Même résultat avec une boucle: {somme_boucle})")
 
 except ValueError:
     print(f"Erreur: '{n_str}' n'est pas un nombre entier valide.")
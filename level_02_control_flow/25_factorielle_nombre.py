@@ -1,3 +1,5 @@
+import math
+
 n_str = "5" # Simule une saisie
 
 try:
@@ -7,9 +9,8 @@ try:
     elif n == 0:
         print("La factorielle de 0 est 1.")
     else:
-        factorielle = 1
-        for i in range(1, n + 1):
-            factorielle *= i
+        # math.factorial est implémentée en C (entiers Python sans limite de taille)
+        factorielle = math.factorial(n)
         print(f"La factorielle de {n} est {factorielle}.")
 except ValueError:
     print(f"Erreur: '{n_str}' n'est pas un nombre entier valide.")
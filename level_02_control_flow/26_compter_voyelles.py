@@ -1,20 +1,32 @@
 chaine_utilisateur = "Bonjour le Monde"
 voyelles = "aeiouAEIOUàáâäéèêëíìîïóòôöúùûüÀÁÂÄÉÈÊËÍÌÎÏÓÒÔÖÚÙÛÜ"
 
-compteur_voyelles = 0
+# Table et ensemble construits une seule fois à partir de `voyelles` :
+# les deux comptages utilisent exactement les mêmes voyelles
+TABLE_SANS_VOYELLES = str.maketrans("", "", voyelles)
+ENSEMBLE_VOYELLES = frozenset(voyelles)
+
+
+def compter_voyelles(chaine):
+    """
+    Compte les voyelles sans boucle Python : str.translate supprime les
+    voyelles, la différence de longueur donne leur nombre.
+    """
+    return len(chaine) - len(chaine.translate(TABLE_SANS_VOYELLES))
+
 
 print(f"Analyse de la chaîne: '{chaine_utilisateur}'")
-for caractere in chaine_utilisateur:
-    if caractere in voyelles:
-        compteur_voyelles += 1
+compteur_voyelles = compter_voyelles(chaine_utilisateur)
 
 print(f"La chaîne '{chaine_utilisateur}' contient {compteur_voyelles} voyelles.")
 
-# Variante: convertir la chaîne en minuscules d'abord
-chaine_minuscules = chaine_utilisateur.lower()
-voyelles_minuscules = "aeiouàáâäéèêëíìîïóòôöúùûü"
+# Variante: boucle explicite, chaque caractère est mis en minuscule au passage
+# (pas de copie complète de la chaîne avec .lower()) et testé dans le frozenset.
+# La minuscule peut compter plusieurs caractères (« İ » -> « i » + point) :
+# chacun est testé, comme dans la chaîne entière mise en minuscules
 compteur_voyelles_variante = 0
-for caractere in chaine_minuscules:
-    if caractere in voyelles_minuscules:
-        compteur_voyelles_variante +=1
+for caractere in chaine_utilisateur:
+    for minuscule in caractere.lower():
+        if minuscule in ENSEMBLE_VOYELLES:
+            compteur_voyelles_variante += 1
 print(f"(Variante avec conversion en minuscules: {compteur_voyelles_variante} voyelles)") 
\ No newline at end of file
@@ -5,11 +5,11 @@ chaine_inverse_slicing = chaine_originale[::-1]
 print(f"Chaîne originale: '{chaine_originale}'")
 print(f"Inverse (avec slicing): '{chaine_inverse_slicing}'")
 
-# Méthode avec une boucle (plus explicite)
-chaine_inverse_boucle = ""
-for caractere in chaine_originale:
-    chaine_inverse_boucle = caractere + chaine_inverse_boucle # Ajoute au début
-print(f"Inverse (avec boucle): '{chaine_inverse_boucle}'")
+# Méthode avec reversed + join (plus explicite)
+# À éviter : `inverse = caractere + inverse` dans une boucle recrée une chaîne
+# à chaque tour, soit un coût O(n²). join construit le résultat en une fois.
+chaine_inverse_join = "".join(reversed(chaine_originale))
+print(f"Inverse (avec reversed + join): '{chaine_inverse_join}'")
 
 # Test avec une chaîne vide ou un palindrome
 # palindrome = "radar"
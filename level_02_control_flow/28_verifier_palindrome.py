@@ -1,11 +1,15 @@
+import string
+
 chaine_test = "radar" # Exemple de palindrome
 chaine_test_non_palindrome = "Python"
 
+# Table de traduction précalculée : supprime espaces et ponctuation en une passe
+_A_SUPPRIMER = str.maketrans("", "", string.whitespace + string.punctuation)
+
 def est_palindrome(s):
-    # Optionnel: prétraitement pour ignorer la casse et les espaces
-    # s_preparee = "".join(s.lower().split()) 
-    # return s_preparee == s_preparee[::-1]
-    return s == s[::-1] # Version simple
+    # Prétraitement pour ignorer la casse, les espaces et la ponctuation
+    s_preparee = s.translate(_A_SUPPRIMER).casefold()
+    return s_preparee == s_preparee[::-1]
 
 print(f"Analyse de '{chaine_test}':")
 if est_palindrome(chaine_test):
@@ -19,10 +23,10 @@ if est_palindrome(chaine_test_non_palindrome):
 else:
     print(f"'{chaine_test_non_palindrome}' n'est pas un palindrome.")
 
-# Test avec casse et espaces (nécessiterait le prétraitement commenté)
+# Test avec casse et espaces (géré par le prétraitement)
 # chaine_complexe = "Engage le jeu que je le gagne"
-# print(f"\nAnalyse de '{chaine_complexe}' (avec prétraitement idéal):")
-# if est_palindrome(chaine_complexe): # Ne fonctionnera qu'avec le prétraitement actif
+# print(f"\nAnalyse de '{chaine_complexe}':")
+# if est_palindrome(chaine_complexe):
 #     print(f"'{chaine_complexe}' est un palindrome.")
 # else:
 #     print(f"'{chaine_complexe}' n'est pas un palindrome.") 
\ No newline at end of file
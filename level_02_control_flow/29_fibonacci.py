@@ -7,11 +7,13 @@ try:
     elif n == 1:
         print(f"Les {n} premiers nombres de Fibonacci sont: [0]")
     else:
-        fib_sequence = [0, 1]
-        # On a déjà 2 termes, donc on boucle n-2 fois
-        for _ in range(2, n):
-            prochain_nombre = fib_sequence[-1] + fib_sequence[-2]
-            fib_sequence.append(prochain_nombre)
+        # Liste préallouée ; les deux derniers termes restent dans a et b
+        fib_sequence = [0] * n
+        fib_sequence[1] = 1
+        a, b = 0, 1
+        for i in range(2, n):
+            a, b = b, a + b
+            fib_sequence[i] = b
         print(f"Les {n} premiers nombres de Fibonacci sont: {fib_sequence}")
 
 except ValueError:
@@ -1,3 +1,5 @@
+import math
+
 n_str = "91" # Simule une saisie
 
 try:
@@ -5,13 +7,21 @@ try:
     if n <= 1:
         print("Erreur: Veuillez entrer un entier strictement supérieur à 1.")
     else:
-        for diviseur in range(2, n + 1):
-            if n % diviseur == 0:
-                if diviseur == n:
-                    print(f"{n} est un nombre premier.")
-                else:
+        if n % 2 == 0:
+            if n == 2:
+                print(f"{n} est un nombre premier.")
+            else:
+                print(f"Le plus petit diviseur de {n} autre que 1 est 2.")
+        else:
+            # n est impair : inutile de tester les diviseurs pairs.
+            # Si n n'a aucun diviseur <= √n, alors n est premier
+            limite = math.isqrt(n)
+            for diviseur in range(3, limite + 1, 2):
+                if n % diviseur == 0:
                     print(f"Le plus petit diviseur de {n} autre que 1 est {diviseur}.")
-                break
+                    break
+            else:
+                print(f"{n} est un nombre premier.")
 except ValueError:
     print(f"Erreur: '{n_str}' n'est pas un nombre entier valide.")
 
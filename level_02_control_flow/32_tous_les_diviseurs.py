@@ -1,3 +1,5 @@
+import math
+
 n_str = "36" # Simule une saisie
 
 try:
@@ -5,11 +7,15 @@ try:
     if n <= 0:
         print("Erreur: Veuillez entrer un entier strictement positif.")
     else:
-        diviseurs = []
-        for i in range(1, n + 1):
+        # Les diviseurs vont par paires (i, n // i) : il suffit d'aller jusqu'à √n
+        petits, grands = [], []
+        for i in range(1, math.isqrt(n) + 1):
             if n % i == 0:
-                diviseurs.append(i)
-        diviseurs_str = ", ".join(str(d) for d in diviseurs)
+                petits.append(i)
+                if i != n // i:
+                    grands.append(n // i)
+        diviseurs = petits + grands[::-1]
+        diviseurs_str = ", ".join(map(str, diviseurs))
         print(f"Les diviseurs de {n} sont: {diviseurs_str}")
 except ValueError:
     print(f"Erreur: '{n_str}' n'est pas un nombre entier valide.")
@@ -1,9 +1,23 @@
+import bisect
+
 n_str = "123456" # Simule une saisie
 
+# Puissances de 10 précalculées : 10, 100, ..., 10**19
+PUISSANCES_DE_10 = [10**i for i in range(1, 20)]
+
+
+def compter_chiffres(n):
+    """Nombre de chiffres de n (signe ignoré), sans conversion en chaîne."""
+    n_abs = abs(n)
+    if n_abs < PUISSANCES_DE_10[-1]:
+        # Nombre de puissances de 10 <= n_abs, plus le chiffre des unités
+        return bisect.bisect_right(PUISSANCES_DE_10, n_abs) + 1
+    return len(str(n_abs)) # Très grands entiers
+
+
 try:
     n = int(n_str)
-    n_abs_str = str(abs(n)) # On ignore le signe
-    nb_chiffres = len(n_abs_str)
+    nb_chiffres = compter_chiffres(n)
     print(f"Le nombre {n} contient {nb_chiffres} chiffres.")
 except ValueError:
     print(f"Erreur: '{n_str}' n'est pas un nombre entier valide.")
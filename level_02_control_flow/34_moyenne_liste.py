@@ -1,9 +1,11 @@
 liste_nombres = [10, 20, 30, 40, 50]
 
-if len(liste_nombres) == 0:
+taille = len(liste_nombres)
+
+if taille == 0:
     print("Erreur: La liste est vide, impossible de calculer la moyenne.")
 else:
-    moyenne = sum(liste_nombres) / len(liste_nombres)
+    moyenne = sum(liste_nombres) / taille
     print(f"La moyenne des valeurs {liste_nombres} est {moyenne:.1f}.")
 
 # Test avec une liste vide
@@ -45,10 +45,7 @@ infos_personne(age=30, ville="Paris", nom="Claire")
 
 # --- Nombre variable d'arguments ---
 def additionner(*nombres):
-    total = 0
-    for n in nombres:
-        total += n
-    return total
+    return sum(nombres)  # sum() est implémentée en C
 
 print(f"Somme de 1, 2, 3 : {additionner(1, 2, 3)}")
 print(f"Somme de 5, 10 : {additionner(5, 10)}")
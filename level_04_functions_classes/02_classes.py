@@ -10,6 +10,8 @@ Introduction aux classes en Python
 
 # Définition d'une classe simple
 class Personne:
+    __slots__ = ('nom', 'age')  # Pas de __dict__ par instance : objets plus compacts
+
     def __init__(self, nom, age):
         self.nom = nom  # Attribut d'instance
         self.age = age
@@ -36,6 +38,8 @@ print(alice)
 
 # --- Héritage ---
 class Employe(Personne):
+    __slots__ = ('poste',)  # Les slots de Personne sont hérités
+
     def __init__(self, nom, age, poste):
         super().__init__(nom, age)  # Appel au constructeur de la classe parente
         self.poste = poste
@@ -74,6 +78,8 @@ print(f"Addition statique : {Utilitaires.addition(10, 5)}")
 
 # --- Encapsulation et Propriétés ---
 class CompteBancaire:
+    __slots__ = ('titulaire', '__solde')  # '__solde' est aussi renommé en _CompteBancaire__solde
+
     def __init__(self, titulaire, solde_initial):
         self.titulaire = titulaire
         self.__solde = solde_initial  # Attribut "privé" par convention (name mangling)
@@ -2,11 +2,14 @@
 Concepts OOP Avancés : Héritage, Polymorphisme, Interfaces (ABCs)
 """
 
+import math
 from abc import ABC, abstractmethod
 
 # --- Héritage et Polymorphisme ---
 
 class Animal(ABC):  # Animal devient une classe de base abstraite
+    __slots__ = ('nom',)
+
     def __init__(self, nom):
         self.nom = nom
 
@@ -19,6 +22,8 @@ class Animal(ABC):  # Animal devient une classe de base abstraite
         print(f"{self.nom} mange.")
 
 class Chien(Animal):
+    __slots__ = ()
+
     def crier(self):
         return f"{self.nom} aboie : Ouaf ouaf !"
 
@@ -26,6 +31,8 @@ class Chien(Animal):
         print(f"{self.nom} rapporte la balle.")
 
 class Chat(Animal):
+    __slots__ = ()
+
     def crier(self):
         return f"{self.nom} miaule : Miaou !"
 
@@ -61,6 +68,8 @@ for animal in animaux:
 # --- Interfaces (Abstract Base Classes) ---
 
 class Forme(ABC):
+    __slots__ = ()  # Pas de __dict__ hérité : les sous-classes peuvent déclarer leurs slots
+
     @abstractmethod
     def aire(self):
         pass
@@ -70,18 +79,20 @@ class Forme(ABC):
         pass
 
 class Cercle(Forme):
+    __slots__ = ('rayon',)
+
     def __init__(self, rayon):
         self.rayon = rayon
 
     def aire(self):
-        import math
-        return math.pi * self.rayon ** 2
+        return math.pi * self.rayon * self.rayon
 
     def perimetre(self):
-        import math
         return 2 * math.pi * self.rayon
 
 class Rectangle(Forme):
+    __slots__ = ('longueur', 'largeur')
+
     def __init__(self, longueur, largeur):
         self.longueur = longueur
         self.largeur = largeur
@@ -7,6 +7,8 @@ Introduction à la programmation orientée objet (POO)
 """
 
 class Chien:
+    __slots__ = ('nom', 'age')
+
     def __init__(self, nom, age):
         self.nom = nom
         self.age = age
@@ -7,6 +7,8 @@ Classes avancées en Python
 """
 
 class Animal:
+    __slots__ = ('nom',)
+
     def __init__(self, nom):
         self.nom = nom
 
@@ -25,6 +27,8 @@ class Animal:
         print("Les animaux sont des êtres vivants.")
 
 class Chat(Animal):
+    __slots__ = ()
+
     def parler(self):
         print(f"{self.nom} miaule.")
 
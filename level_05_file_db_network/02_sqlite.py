@@ -8,10 +8,30 @@ Utilisation de SQLite en Python
 """
 import sqlite3
 
-# Connexion à la base (fichier local)
-conn = sqlite3.connect("exemple.db")
+# Requêtes paramétrées définies une seule fois : le texte SQL est toujours
+# identique, donc SQLite réutilise la requête déjà préparée (cache de la connexion)
+SQL_INSERT = "INSERT INTO utilisateurs (nom, age) VALUES (?, ?)"
+SQL_SELECT_TOUS = "SELECT * FROM utilisateurs"
+SQL_UPDATE_AGE = "UPDATE utilisateurs SET age = ? WHERE nom = ?"
+SQL_DELETE_NOM = "DELETE FROM utilisateurs WHERE nom = ?"
+
+# Connexion à la base (fichier local), avec un cache de requêtes préparées agrandi
+conn = sqlite3.connect("exemple.db", cached_statements=256)
 cursor = conn.cursor()
 
+# Réglages de performance :
+# - WAL : les écritures vont dans un journal séparé (fichiers exemple.db-wal et
+#   exemple.db-shm créés à côté de la base), les lectures ne sont plus bloquées
+# - synchronous=NORMAL : moins de fsync par commit, sûr en mode WAL
+# - temp_store, cache_size (64 Mio), mmap_size (256 Mio) : moins d'accès disque
+conn.executescript("""
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA cache_size=-65536;
+PRAGMA mmap_size=268435456;
+""")
+
 # Création d'une table
 cursor.execute("""
 CREATE TABLE IF NOT EXISTS utilisateurs (
@@ -21,29 +41,36 @@ CREATE TABLE IF NOT EXISTS utilisateurs (
 )
 """)
 
-# Insertion de données
-cursor.execute("INSERT INTO utilisateurs (nom, age) VALUES (?, ?)", ("Alice", 30))
-cursor.execute("INSERT INTO utilisateurs (nom, age) VALUES (?, ?)", ("Bob", 25))
-conn.commit()
+def generer_utilisateurs():
+    """Produit les lignes à insérer une à une (mémoire constante, même pour un gros volume)."""
+    for nom, age in (("Alice", 30), ("Bob", 25)):
+        yield nom, age
+
+# Insertion de données : une seule transaction pour toutes les lignes
+# (le bloc `with conn` valide une seule fois à la sortie, ou annule en cas d'erreur).
+# executemany prépare la requête une fois et consomme le générateur côté C.
+with conn:
+    cursor.executemany(SQL_INSERT, generer_utilisateurs())
 
 # Requête
-cursor.execute("SELECT * FROM utilisateurs")
+cursor.execute(SQL_SELECT_TOUS)
 print("Utilisateurs :")
 for row in cursor.fetchall():
     print(row)
 
-# Mise à jour
-cursor.execute("UPDATE utilisateurs SET age = ? WHERE nom = ?", (31, "Alice"))
-conn.commit()
+with conn:
+    # Mise à jour
+    cursor.execute(SQL_UPDATE_AGE, (31, "Alice"))
 
-# Suppression
-cursor.execute("DELETE FROM utilisateurs WHERE nom = ?", ("Bob",))
-conn.commit()
+    # Suppression
+    cursor.execute(SQL_DELETE_NOM, ("Bob",))
 
 # Affichage final
-cursor.execute("SELECT * FROM utilisateurs")
+cursor.execute(SQL_SELECT_TOUS)
 print("\nAprès mise à jour et suppression :")
 for row in cursor.fetchall():
     print(row)
 
-conn.close() 
\ No newline at end of file
+# Met à jour les statistiques de l'optimiseur pour les prochaines exécutions
+cursor.execute("PRAGMA optimize")
+conn.close()
@@ -3,21 +3,52 @@ Requêtes HTTP en Python avec requests
 - GET
 - POST
 - Gestion des erreurs
+- Session (réutilisation des connexions)
+- Requêtes en parallèle
 """
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
+from requests.adapters import HTTPAdapter
 
-# Requête GET
 try:
-    response = requests.get("https://httpbin.org/get", timeout=5)
+    import orjson  # Optionnel : décodage JSON plus rapide (pip install orjson)
+except ImportError:
+    orjson = None
+
+
+def lire_json(response):
+    """Décode le corps JSON d'une réponse, directement depuis les octets si possible."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+# Une session garde ses connexions ouvertes (keep-alive) : la poignée de main
+# TCP + TLS n'est payée qu'une fois pour toutes les requêtes vers le même hôte
+session = requests.Session()
+session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=3))
+
+# Les deux requêtes partent en même temps (deux threads, une seule session) :
+# le temps total est celui de la plus lente, pas la somme des deux
+with ThreadPoolExecutor(max_workers=2) as executor:
+    futur_get = executor.submit(session.get, "https://httpbin.org/get", timeout=5)
+    futur_post = executor.submit(session.post, "https://httpbin.org/post", data={"nom": "Alice"}, timeout=5)
+
+# Requête GET (result() renvoie la réponse ou relance l'exception du thread)
+try:
+    response = futur_get.result()
     print("GET /get :", response.status_code)
-    print(response.json())
+    print(lire_json(response))
 except Exception as e:
     print("Erreur GET :", e)
 
 # Requête POST
 try:
-    response = requests.post("https://httpbin.org/post", data={"nom": "Alice"}, timeout=5)
+    response = futur_post.result()
     print("\nPOST /post :", response.status_code)
-    print(response.json())
+    print(lire_json(response))
 except Exception as e:
-    print("Erreur POST :", e) 
\ No newline at end of file
+    print("Erreur POST :", e)
+
+session.close()
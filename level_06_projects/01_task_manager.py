@@ -8,7 +8,7 @@ Un gestionnaire de tâches simple mais complet qui permet de :
 - Marquer comme terminé/en cours
 - Supprimer des tâches
 - Voir les statistiques
-- Sauvegarder automatiquement en JSON
+- Sauvegarder automatiquement en JSON (journal des modifications + instantané)
 
 Auteur: Méthode Markova
 Niveau: 06 - Mini-projets concrets
@@ -19,9 +19,28 @@ import os
 from datetime import datetime
 from typing import List, Dict, Any
 
+try:
+    import orjson  # Optionnel : sérialisation JSON plus rapide (pip install orjson)
+except ImportError:
+    orjson = None
+
+# Taille minimale du journal avant réécriture complète du fichier JSON
+JOURNAL_COMPACT_MIN = 50
+
+# Tampon de 256 Kio (au lieu de 8 Kio par défaut) : moins d'appels système
+# pour lire ou écrire de gros fichiers
+IO_BUFFER_SIZE = 256 * 1024
+
 
 class TaskManager:
-    """Gestionnaire de tâches avec persistance JSON."""
+    """
+    Gestionnaire de tâches avec persistance JSON.
+    
+    Chaque modification est ajoutée en fin de journal (une ligne JSON par
+    opération) au lieu de réécrire tout le fichier. Le fichier JSON complet
+    n'est réécrit que lorsque le journal devient plus long que la liste des
+    tâches, puis le journal est vidé.
+    """
     
     def __init__(self, filename: str = "tasks.json"):
         """
@@ -31,27 +50,146 @@ class TaskManager:
             filename: Nom du fichier de sauvegarde
         """
         self.filename = filename
+        self.journal_filename = filename + ".journal"
+        self._journal_size = 0  # Nombre d'opérations en attente dans le journal
         self.tasks: List[Dict[str, Any]] = []
+        self._index: Dict[int, int] = {}  # id de tâche -> position dans self.tasks
+        self._next_id = 1
         self.load_tasks()
     
     def load_tasks(self) -> None:
-        """Charge les tâches depuis le fichier JSON."""
+        """Charge les tâches depuis le fichier JSON puis rejoue le journal."""
         try:
             if os.path.exists(self.filename):
-                with open(self.filename, 'r', encoding='utf-8') as f:
-                    self.tasks = json.load(f)
+                if orjson is not None:
+                    with open(self.filename, 'rb', buffering=IO_BUFFER_SIZE) as f:
+                        self.tasks = orjson.loads(f.read())
+                else:
+                    with open(self.filename, 'r', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f:
+                        self.tasks = json.load(f)
+                self._rebuild_index()
+                self._replay_journal()
+                print(f"✅ {len(self.tasks)} tâche(s) chargée(s)")
+            elif os.path.exists(self.journal_filename):
+                self._replay_journal()
                 print(f"✅ {len(self.tasks)} tâche(s) chargée(s)")
             else:
                 print("📝 Nouveau fichier de tâches créé")
         except (json.JSONDecodeError, FileNotFoundError) as e:
             print(f"⚠️  Erreur lors du chargement : {e}")
             self.tasks = []
+        self._rebuild_index()
+    
+    def _replay_journal(self) -> None:
+        """Applique les opérations du journal sur les tâches chargées."""
+        if not os.path.exists(self.journal_filename):
+            return
+        
+        good_end = 0  # Fin (en octets) de la dernière ligne lisible
+        damaged = False
+        with open(self.journal_filename, 'rb', buffering=IO_BUFFER_SIZE) as f:
+            for line in f:
+                try:
+                    entry = orjson.loads(line) if orjson is not None else json.loads(line)
+                except json.JSONDecodeError:
+                    damaged = True
+                    break
+                self._apply(entry)
+                self._journal_size += 1
+                good_end += len(line)
+        
+        if damaged:
+            # Dernière ligne tronquée (arrêt brutal) : on coupe le journal juste
+            # après la dernière ligne lisible, sinon la prochaine opération
+            # serait écrite à la suite du fragment et perdue au chargement suivant
+            print("⚠️  Fin du journal illisible, ignorée")
+            with open(self.journal_filename, 'r+b') as f:
+                f.truncate(good_end)
+        elif good_end and not line.endswith(b"\n"):
+            # Dernière ligne complète mais sans fin de ligne : on la termine
+            with open(self.journal_filename, 'ab') as f:
+                f.write(b"\n")
+    
+    def _apply(self, entry: Dict[str, Any]) -> None:
+        """
+        Applique une opération du journal aux tâches en mémoire.
+        
+        Les opérations déjà présentes dans le fichier JSON sont ignorées,
+        ce qui permet de rejouer un journal sans risque de doublon.
+        
+        Args:
+            entry: Opération ({"op": "add" | "complete" | "delete", ...})
+        """
+        op = entry["op"]
+        if op == "add":
+            task = entry["task"]
+            if task["id"] not in self._index:
+                self._index[task["id"]] = len(self.tasks)
+                self._next_id = max(self._next_id, task["id"] + 1)
+                self.tasks.append(task)
+        elif op == "complete":
+            position = self._index.get(entry["id"])
+            if position is not None:
+                task = self.tasks[position]
+                task["status"] = "terminee"
+                task["completed_at"] = entry["completed_at"]
+        elif op == "delete":
+            position = self._index.pop(entry["id"], None)
+            if position is not None:
+                self.tasks.pop(position)
+                self._rebuild_index(position)  # Seules les tâches suivantes se décalent
+    
+    def _record(self, entry: Dict[str, Any]) -> None:
+        """
+        Applique une opération et l'ajoute à la fin du journal.
+        
+        Args:
+            entry: Opération à enregistrer
+        """
+        self._apply(entry)
+        
+        if self._journal_size >= max(JOURNAL_COMPACT_MIN, len(self.tasks)):
+            # Journal trop long : on réécrit l'instantané complet
+            self.save_tasks()
+            return
+        
+        try:
+            if orjson is not None:
+                line = orjson.dumps(entry) + b"\n"
+            else:
+                line = json.dumps(entry, ensure_ascii=False).encode('utf-8') + b"\n"
+            with open(self.journal_filename, 'ab') as f:
+                f.write(line)
+            self._journal_size += 1
+            print("💾 Tâches sauvegardées")
+        except Exception as e:
+            print(f"❌ Erreur lors de la sauvegarde : {e}")
+    
+    def _rebuild_index(self, start: int = 0) -> None:
+        """
+        Met à jour l'index id -> position à partir d'une position donnée.
+        
+        Args:
+            start: Première position à réindexer (0 pour tout reconstruire)
+        """
+        if start == 0:
+            self._index = {}
+        for i in range(start, len(self.tasks)):
+            self._index[self.tasks[i]["id"]] = i
+        self._next_id = max(self._next_id, max(self._index, default=0) + 1)
     
     def save_tasks(self) -> None:
-        """Sauvegarde les tâches dans le fichier JSON."""
+        """Sauvegarde toutes les tâches dans le fichier JSON et vide le journal."""
         try:
-            with open(self.filename, 'w', encoding='utf-8') as f:
-                json.dump(self.tasks, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                with open(self.filename, 'wb', buffering=IO_BUFFER_SIZE) as f:
+                    f.write(orjson.dumps(self.tasks, option=orjson.OPT_INDENT_2))
+            else:
+                with open(self.filename, 'w', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f:
+                    json.dump(self.tasks, f, indent=2, ensure_ascii=False)
+            if os.path.exists(self.journal_filename):
+                os.remove(self.journal_filename)
+            self._journal_size = 0
             print("💾 Tâches sauvegardées")
         except Exception as e:
             print(f"❌ Erreur lors de la sauvegarde : {e}")
@@ -69,7 +207,7 @@ class TaskManager:
             return
         
         task = {
-            "id": len(self.tasks) + 1,
+            "id": self._next_id,
             "description": description.strip(),
             "priority": priority.lower(),
             "status": "en_cours",
@@ -77,8 +215,7 @@ class TaskManager:
             "completed_at": None
         }
         
-        self.tasks.append(task)
-        self.save_tasks()
+        self._record({"op": "add", "task": task})
         print(f"✅ Tâche ajoutée : {description}")
     
     def complete_task(self, task_id: int) -> None:
@@ -88,19 +225,22 @@ class TaskManager:
         Args:
             task_id: ID de la tâche à terminer
         """
-        for task in self.tasks:
-            if task["id"] == task_id:
-                if task["status"] == "terminee":
-                    print("ℹ️  Cette tâche est déjà terminée")
-                    return
-                
-                task["status"] = "terminee"
-                task["completed_at"] = datetime.now().isoformat()
-                self.save_tasks()
-                print(f"🎉 Tâche terminée : {task['description']}")
-                return
+        position = self._index.get(task_id)
+        if position is None:
+            print(f"❌ Aucune tâche trouvée avec l'ID {task_id}")
+            return
         
-        print(f"❌ Aucune tâche trouvée avec l'ID {task_id}")
+        task = self.tasks[position]
+        if task["status"] == "terminee":
+            print("ℹ️  Cette tâche est déjà terminée")
+            return
+        
+        self._record({
+            "op": "complete",
+            "id": task_id,
+            "completed_at": datetime.now().isoformat()
+        })
+        print(f"🎉 Tâche terminée : {task['description']}")
     
     def delete_task(self, task_id: int) -> None:
         """
@@ -109,14 +249,14 @@ class TaskManager:
         Args:
             task_id: ID de la tâche à supprimer
         """
-        for i, task in enumerate(self.tasks):
-            if task["id"] == task_id:
-                deleted_task = self.tasks.pop(i)
-                self.save_tasks()
-                print(f"🗑️  Tâche supprimée : {deleted_task['description']}")
-                return
+        position = self._index.get(task_id)
+        if position is None:
+            print(f"❌ Aucune tâche trouvée avec l'ID {task_id}")
+            return
         
-        print(f"❌ Aucune tâche trouvée avec l'ID {task_id}")
+        deleted_task = self.tasks[position]
+        self._record({"op": "delete", "id": task_id})
+        print(f"🗑️  Tâche supprimée : {deleted_task['description']}")
     
     def list_tasks(self, filter_status: str = "all") -> None:
         """
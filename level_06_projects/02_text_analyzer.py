@@ -16,9 +16,45 @@ Niveau: 06 - Mini-projets concrets
 
 import re
 import json
-from collections import Counter
+import importlib.util
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from functools import cached_property
 from typing import Dict, List, Tuple, Set
 import string
+from datetime import datetime
+
+try:
+    import orjson  # Optionnel : sérialisation JSON plus rapide (pip install orjson)
+except ImportError:
+    orjson = None
+
+# Optionnel : comptage vectorisé pour les très longs textes. PyArrow est lourd
+# à charger, il n'est donc importé qu'au premier texte qui en a besoin.
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+# Au-delà de ce nombre de mots, le comptage passe par PyArrow (si installé)
+ARROW_MIN_WORDS = 50_000
+
+# Tampon de 256 Kio (au lieu de 8 Kio par défaut) : moins d'appels système
+# pour lire ou écrire de gros fichiers
+IO_BUFFER_SIZE = 256 * 1024
+
+# Expressions régulières compilées une seule fois au chargement du module
+_WS_RE = re.compile(r'\s+')
+_WORD_RE = re.compile(r"\b[a-zA-ZÀ-ÿ']+\b")
+
+# Mots vides courants (français et anglais) exclus de la fréquence des mots
+_STOP_WORDS = frozenset({
+    'le', 'de', 'et', 'à', 'un', 'il', 'être', 'en', 'avoir', 'que', 'pour',
+    'dans', 'ce', 'son', 'une', 'sur', 'avec', 'ne', 'se', 'pas', 'tout', 'plus',
+    'par', 'grand', 'autre', 'dont', 'lui', 'très', 'sa', 'me', 'jour',
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with',
+    'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does',
+    'did', 'will', 'would', 'could', 'should', 'may', 'might', 'must', 'can', 'this',
+    'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they', 'him',
+    'her', 'us', 'them', 'my', 'your', 'his', 'its', 'our', 'their'
+})
 
 
 class TextAnalyzer:
@@ -47,7 +83,7 @@ class TextAnalyzer:
             Texte nettoyé
         """
         # Supprime les caractères de contrôle et normalise les espaces
-        cleaned = re.sub(r'\s+', ' ', text.strip())
+        cleaned = _WS_RE.sub(' ', text.strip())
         return cleaned
     
     def _extract_words(self) -> List[str]:
@@ -57,9 +93,10 @@ class TextAnalyzer:
         Returns:
             Liste des mots en minuscules
         """
-        # Utilise regex pour extraire les mots (lettres et apostrophes)
-        words = re.findall(r"\b[a-zA-ZÀ-ÿ']+\b", self.cleaned_text.lower())
-        return words
+        # Utilise regex pour extraire les mots (lettres et apostrophes) sur le
+        # texte déjà en minuscules : mettre en minuscules après coup changerait
+        # le découpage pour les lettres comme Ÿ, hors de la classe À-ÿ
+        return _WORD_RE.findall(self.cleaned_text.lower())
     
     def _extract_sentences(self) -> List[str]:
         """
@@ -68,9 +105,10 @@ class TextAnalyzer:
         Returns:
             Liste des phrases
         """
-        # Divise sur les points, exclamations, interrogations
-        sentences = re.split(r'[.!?]+', self.cleaned_text)
-        # Supprime les phrases vides et nettoie
+        # Divise sur les points, exclamations, interrogations : les '!' et '?'
+        # deviennent des '.', puis un simple split (en C) remplace la regex
+        sentences = self.cleaned_text.replace('!', '.').replace('?', '.').split('.')
+        # Supprime les phrases vides (dont celles entre ponctuations successives) et nettoie
         sentences = [s.strip() for s in sentences if s.strip()]
         return sentences
     
@@ -78,12 +116,23 @@ class TextAnalyzer:
         """
         Calcule les statistiques de base.
         
+        Returns:
+            Dictionnaire avec les statistiques
+        """
+        return dict(self._basic_stats)
+    
+    @cached_property
+    def _basic_stats(self) -> Dict[str, int]:
+        """
+        Statistiques de base, calculées une seule fois par texte
+        (réutilisées par readability_score et export_analysis).
+        
         Returns:
             Dictionnaire avec les statistiques
         """
         return {
             "characters_total": len(self.original_text),
-            "characters_no_spaces": len(self.original_text.replace(" ", "")),
+            "characters_no_spaces": len(self.original_text) - self.original_text.count(" "),
             "words": len(self.words),
             "unique_words": len(set(self.words)),
             "sentences": len(self.sentences),
@@ -100,27 +149,40 @@ class TextAnalyzer:
         Returns:
             Liste de tuples (mot, fréquence)
         """
-        # Exclut les mots vides courants
-        stop_words = {
-            'le', 'de', 'et', 'à', 'un', 'il', 'être', 'et', 'en', 'avoir', 'que', 'pour',
-            'dans', 'ce', 'son', 'une', 'sur', 'avec', 'ne', 'se', 'pas', 'tout', 'plus',
-            'par', 'grand', 'en', 'une', 'autre', 'dont', 'lui', 'très', 'sa', 'me', 'jour',
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with',
-            'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does',
-            'did', 'will', 'would', 'could', 'should', 'may', 'might', 'must', 'can', 'this',
-            'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they', 'me', 'him',
-            'her', 'us', 'them', 'my', 'your', 'his', 'its', 'our', 'their'
-        }
-        
-        # Filtre les mots vides et trop courts
-        meaningful_words = [
-            word for word in self.words 
-            if word not in stop_words and len(word) > 2
-        ]
+        if _HAS_PYARROW and len(self.words) > ARROW_MIN_WORDS:
+            return self._word_frequency_arrow(top_n)
         
-        word_counts = Counter(meaningful_words)
+        # Filtre les mots vides et trop courts, puis compte en une seule passe
+        word_counts = Counter(
+            word for word in self.words
+            if len(word) > 2 and word not in _STOP_WORDS
+        )
         return word_counts.most_common(top_n)
     
+    def _word_frequency_arrow(self, top_n: int) -> List[Tuple[str, int]]:
+        """
+        Variante de word_frequency pour les grands textes : filtrage et
+        comptage sont faits en C par PyArrow au lieu d'une boucle Python.
+        
+        Args:
+            top_n: Nombre de mots les plus fréquents à retourner
+            
+        Returns:
+            Liste de tuples (mot, fréquence), dans le même ordre que Counter.most_common
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        
+        words = pa.array(self.words, type=pa.string())
+        mask = pc.and_(
+            pc.greater(pc.utf8_length(words), 2),
+            pc.invert(pc.is_in(words, value_set=pa.array(sorted(_STOP_WORDS))))
+        )
+        counts = pc.value_counts(pc.filter(words, mask))
+        pairs = zip(counts.field("values").to_pylist(), counts.field("counts").to_pylist())
+        # Tri stable : à fréquence égale, l'ordre de première apparition est conservé
+        return sorted(pairs, key=lambda pair: pair[1], reverse=True)[:top_n]
+    
     def readability_score(self) -> Dict[str, float]:
         """
         Calcule des métriques de lisibilité.
@@ -164,13 +226,18 @@ class TextAnalyzer:
         flags = 0 if case_sensitive else re.IGNORECASE
         matches = []
         
+        # Numéro de ligne = nombre de retours à la ligne avant la correspondance,
+        # obtenu par recherche dichotomique plutôt qu'en recomptant le préfixe
+        newline_positions = self._newline_positions
+        
         try:
-            for match in re.finditer(pattern, self.original_text, flags):
+            regex = re.compile(pattern, flags)
+            for match in regex.finditer(self.original_text):
                 matches.append({
                     "text": match.group(),
                     "start": match.start(),
                     "end": match.end(),
-                    "line": self.original_text[:match.start()].count('\n') + 1
+                    "line": bisect_left(newline_positions, match.start()) + 1
                 })
         except re.error as e:
             return [{"error": f"Erreur dans le motif : {e}"}]
@@ -189,20 +256,49 @@ class TextAnalyzer:
         """
         results = {}
         total_words = len(self.words)
+        word_positions = self._word_positions
         
         for keyword in keywords:
-            keyword_lower = keyword.lower()
-            count = self.words.count(keyword_lower)
+            positions = word_positions.get(keyword.lower(), [])
+            count = len(positions)
             density = (count / total_words * 100) if total_words > 0 else 0
             
             results[keyword] = {
                 "count": count,
                 "density": round(density, 2),
-                "positions": [i for i, word in enumerate(self.words) if word == keyword_lower]
+                "positions": list(positions)
             }
         
         return results
     
+    @cached_property
+    def _newline_positions(self) -> List[int]:
+        """
+        Positions (triées) des retours à la ligne du texte original.
+        
+        Returns:
+            Liste des indices des caractères '\\n'
+        """
+        positions = []
+        index = self.original_text.find('\n')
+        while index != -1:
+            positions.append(index)
+            index = self.original_text.find('\n', index + 1)
+        return positions
+    
+    @cached_property
+    def _word_positions(self) -> Dict[str, List[int]]:
+        """
+        Index inversé mot -> positions, construit une seule fois par texte.
+        
+        Returns:
+            Dictionnaire associant chaque mot à la liste de ses positions
+        """
+        positions = defaultdict(list)
+        for i, word in enumerate(self.words):
+            positions[word].append(i)
+        return dict(positions)
+    
     def export_analysis(self, filename: str = "text_analysis.json") -> None:
         """
         Exporte l'analyse complète en JSON.
@@ -215,12 +311,18 @@ class TextAnalyzer:
             "basic_stats": self.basic_stats(),
             "readability": self.readability_score(),
             "top_words": self.word_frequency(15),
-            "analysis_timestamp": str(__import__('datetime').datetime.now())
+            "analysis_timestamp": datetime.now()
         }
         
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(analysis, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                # orjson sérialise les datetime nativement (format ISO 8601)
+                with open(filename, 'wb', buffering=IO_BUFFER_SIZE) as f:
+                    f.write(orjson.dumps(analysis, option=orjson.OPT_INDENT_2))
+            else:
+                with open(filename, 'w', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f:
+                    json.dump(analysis, f, indent=2, ensure_ascii=False,
+                              default=datetime.isoformat)
             print(f"✅ Analyse exportée dans : {filename}")
         except Exception as e:
             print(f"❌ Erreur lors de l'export : {e}")
@@ -237,7 +339,7 @@ def load_text_from_file(filename: str) -> str:
         Contenu du fichier
     """
     try:
-        with open(filename, 'r', encoding='utf-8') as f:
+        with open(filename, 'r', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f:
             return f.read()
     except FileNotFoundError:
         print(f"❌ Fichier non trouvé : {filename}")
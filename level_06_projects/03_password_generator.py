@@ -19,13 +19,61 @@ import string
 import secrets
 import re
 import json
+from collections import Counter
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 
 
-@dataclass
+# Classes de caractères reconnues par l'analyseur (un bit par classe)
+_CLASS_LOWER = 1
+_CLASS_UPPER = 2
+_CLASS_DIGIT = 4
+_CLASS_SYMBOL = 8
+_CLASS_ALL = _CLASS_LOWER | _CLASS_UPPER | _CLASS_DIGIT | _CLASS_SYMBOL
+
+# Table ASCII -> masque de classe, consultée une fois par caractère distinct
+_CLASS_TBL = tuple(
+    (_CLASS_LOWER if chr(i) in string.ascii_lowercase else 0)
+    | (_CLASS_UPPER if chr(i) in string.ascii_uppercase else 0)
+    | (_CLASS_DIGIT if chr(i) in string.digits else 0)
+    | (_CLASS_SYMBOL if chr(i) in "!@#$%^&*()_+-=[]{}|;:,.<>?" else 0)
+    for i in range(128)
+)
+
+# Motifs de l'analyseur, compilés une seule fois au chargement du module
+_RE_REPEAT = re.compile(r'(.)\1{2,}')
+# Suites de 3 caractères : l'alternance est parcourue en C par le moteur re,
+# plus rapide qu'une fenêtre glissante écrite en Python sur les octets
+_RE_NUM_SEQUENCE = re.compile(r'012|123|234|345|456|567|678|789|890')
+_RE_ALPHA_SEQUENCE = re.compile(
+    r'abc|bcd|cde|def|efg|fgh|ghi|hij|ijk|jkl|klm|lmn|mno|nop|opq|pqr|qrs|rst|stu|tuv|uvw|vwx|wxy|xyz'
+)
+
+# Mots de passe trop courants (ensemble figé : recherche en O(1) même s'il grossit)
+_COMMON_PASSWORDS = frozenset({'password', 'motdepasse', '12345678', 'qwerty', 'azerty'})
+
+# Alphabet de secrets.token_urlsafe (base64 « URL-safe »), et longueur à partir
+# de laquelle tirer dans ce texte (tout en C) bat la boucle de _secure_choices
+_URLSAFE_CHARS = frozenset(string.ascii_letters + string.digits + "-_")
+URLSAFE_MIN_LENGTH = 32
+
+# Réponses négatives acceptées aux questions [O/n] (vide = oui, la valeur par défaut)
+_NO_ANSWERS = frozenset({'n', 'non', 'no'})
+
+# Mots courants mais non triviaux pour les phrases de passe
+PASSPHRASE_WORDS = (
+    "horizon", "cascade", "thunder", "whisper", "crystal", "phoenix", "glacier",
+    "bambou", "tornade", "mystere", "lumiere", "aventure", "courage", "silence",
+    "orange", "violet", "bronze", "argent", "rubine", "saphir", "emeraude",
+    "montagne", "riviere", "foret", "desert", "ocean", "planete", "etoile",
+    "papillon", "libellule", "colibri", "elephant", "panthere", "dolphin",
+    "keyboard", "melody", "rhythm", "harmony", "symphony", "poetry", "canvas"
+)
+
+
+@dataclass(slots=True, frozen=True)
 class PasswordCriteria:
-    """Critères pour la génération de mots de passe."""
+    """Critères pour la génération de mots de passe (immuables, sans __dict__)."""
     length: int = 12
     use_uppercase: bool = True
     use_lowercase: bool = True
@@ -49,8 +97,118 @@ class PasswordGenerator:
         self.lowercase = string.ascii_lowercase
         self.digits = string.digits
         self.symbols = "!@#$%^&*()_+-=[]{}|;:,.<>?"
+        
+        # Versions ensemblistes pour les tests d'appartenance (isdisjoint, en C)
+        self._uppercase_set = frozenset(self.uppercase)
+        self._lowercase_set = frozenset(self.lowercase)
+        self._digits_set = frozenset(self.digits)
+        self._symbols_set = frozenset(self.symbols)
+        
+        # Table de suppression des caractères ambigus (str.translate, en C)
+        self._ambig_delete_table = str.maketrans('', '', self.ambiguous_chars)
+        
+        # Générateur système (os.urandom) pour le mode rapide : choices() tire
+        # tout le lot en un seul appel, au prix d'un usage un peu moins strict
+        # que le module secrets
+        self._sysrand = random.SystemRandom()
+        
+        # Pools déjà construits, indexés par les critères qui les déterminent
+        self._pool_cache: Dict[tuple, str] = {}
+        
+        # Tables de suppression pour _urlsafe_choices, par pool (None : pool hors alphabet)
+        self._urlsafe_tables: Dict[str, Optional[dict]] = {}
+    
+    def _secure_choices(self, population, k: int) -> list:
+        """
+        Tire k éléments au hasard avec une qualité cryptographique.
+        
+        Un seul appel à secrets.token_bytes fournit les octets de tout le lot
+        (au lieu d'un appel système par élément avec secrets.choice). Les octets
+        au-delà du plus grand multiple de len(population) sont rejetés pour que
+        chaque élément reste équiprobable.
+        
+        Args:
+            population: Séquence non vide dans laquelle tirer
+            k: Nombre d'éléments à tirer
+            
+        Returns:
+            Liste des k éléments tirés
+        """
+        size = len(population)
+        if size > 256:
+            return [secrets.choice(population) for _ in range(k)]
+        
+        cutoff = 256 - 256 % size
+        result = []
+        while len(result) < k:
+            missing = k - len(result)
+            for byte in secrets.token_bytes(missing + missing // 4 + 8):
+                if byte < cutoff:
+                    result.append(population[byte % size])
+                    if len(result) == k:
+                        break
+        return result
+    
+    def _urlsafe_choices(self, pool: str, k: int) -> Optional[str]:
+        """
+        Tire k caractères du pool dans la sortie de secrets.token_urlsafe.
+        
+        Chaque caractère base64 est équiprobable parmi 64 ; supprimer ceux qui
+        ne sont pas dans le pool (str.translate) laisse un tirage uniforme sur le
+        pool. Le nombre d'octets demandé est un multiple de 3 pour éviter le
+        dernier caractère incomplet, qui ne serait pas uniforme.
+        
+        Args:
+            pool: Caractères autorisés
+            k: Nombre de caractères à tirer
+            
+        Returns:
+            Les k caractères, ou None si le pool sort de l'alphabet URL-safe
+        """
+        if pool not in self._urlsafe_tables:
+            self._urlsafe_tables[pool] = (
+                str.maketrans('', '', ''.join(_URLSAFE_CHARS.difference(pool)))
+                if _URLSAFE_CHARS.issuperset(pool) else None
+            )
+        table = self._urlsafe_tables[pool]
+        if table is None:
+            return None
+        
+        parts = []
+        remaining = k
+        while remaining > 0:
+            # 4 caractères pour 3 octets, dont len(pool)/64 sont conservés
+            nbytes = 3 * (remaining * 64 // (4 * len(pool)) + 2)
+            chunk = secrets.token_urlsafe(nbytes).translate(table)[:remaining]
+            parts.append(chunk)
+            remaining -= len(chunk)
+        return ''.join(parts)
     
     def _get_character_pool(self, criteria: PasswordCriteria) -> str:
+        """
+        Retourne le pool de caractères pour ces critères (construit une seule fois).
+        
+        Args:
+            criteria: Critères de génération
+            
+        Returns:
+            String contenant tous les caractères utilisables
+        """
+        key = (
+            criteria.use_uppercase,
+            criteria.use_lowercase,
+            criteria.use_digits,
+            criteria.use_symbols,
+            criteria.exclude_ambiguous,
+            criteria.exclude_chars,
+        )
+        pool = self._pool_cache.get(key)
+        if pool is None:
+            pool = self._build_character_pool(criteria)
+            self._pool_cache[key] = pool
+        return pool
+    
+    def _build_character_pool(self, criteria: PasswordCriteria) -> str:
         """
         Construit le pool de caractères selon les critères.
         
@@ -60,33 +218,37 @@ class PasswordGenerator:
         Returns:
             String contenant tous les caractères utilisables
         """
-        pool = ""
+        parts = []
         
         if criteria.use_uppercase:
-            pool += self.uppercase
+            parts.append(self.uppercase)
         if criteria.use_lowercase:
-            pool += self.lowercase
+            parts.append(self.lowercase)
         if criteria.use_digits:
-            pool += self.digits
+            parts.append(self.digits)
         if criteria.use_symbols:
-            pool += self.symbols
+            parts.append(self.symbols)
+        
+        pool = ''.join(parts)
         
         # Supprime les caractères ambigus si demandé
         if criteria.exclude_ambiguous:
-            pool = ''.join(c for c in pool if c not in self.ambiguous_chars)
+            pool = pool.translate(self._ambig_delete_table)
         
         # Supprime les caractères exclus personnalisés
         if criteria.exclude_chars:
-            pool = ''.join(c for c in pool if c not in criteria.exclude_chars)
+            pool = pool.translate(str.maketrans('', '', criteria.exclude_chars))
         
         return pool
     
-    def generate_random(self, criteria: PasswordCriteria) -> str:
+    def generate_random(self, criteria: PasswordCriteria, fast: bool = False) -> str:
         """
         Génère un mot de passe aléatoire.
         
         Args:
             criteria: Critères de génération
+            fast: Tire les caractères avec random.SystemRandom().choices au lieu
+                de secrets (par défaut, secrets est conservé)
             
         Returns:
             Mot de passe généré
@@ -96,8 +258,15 @@ class PasswordGenerator:
         if not pool:
             raise ValueError("Aucun caractère disponible avec ces critères")
         
-        # Génération sécurisée avec secrets
-        password = ''.join(secrets.choice(pool) for _ in range(criteria.length))
+        # Génération sécurisée avec secrets (ou SystemRandom en mode rapide)
+        password = None
+        if fast:
+            password = ''.join(self._sysrand.choices(pool, k=criteria.length))
+        elif criteria.length >= URLSAFE_MIN_LENGTH:
+            # Pool sans symbole (lettres/chiffres) : tirage direct dans token_urlsafe
+            password = self._urlsafe_choices(pool, criteria.length)
+        if password is None:
+            password = ''.join(self._secure_choices(pool, criteria.length))
         
         # S'assure que le mot de passe respecte les exigences minimales
         password = self._ensure_criteria_met(password, criteria)
@@ -108,32 +277,71 @@ class PasswordGenerator:
         
         return password
     
-    def generate_pronounceable(self, length: int = 12) -> str:
+    def generate_random_with_hint(self, criteria: PasswordCriteria, fast: bool = False) -> Tuple[str, int]:
+        """
+        Génère un mot de passe aléatoire et indique les classes garanties par construction.
+        
+        Args:
+            criteria: Critères de génération
+            fast: Voir generate_random
+            
+        Returns:
+            Tuple (mot de passe, masque _CLASS_* à passer à analyze(hint_classes=...))
+        """
+        password = self.generate_random(criteria, fast)
+        
+        # _ensure_criteria_met garantit chaque classe demandée dès que la longueur
+        # le permet ; must_include peut en revanche écraser un caractère quelconque
+        hint = 0
+        if not criteria.must_include:
+            if criteria.use_lowercase:
+                hint |= _CLASS_LOWER
+            if criteria.use_uppercase:
+                hint |= _CLASS_UPPER
+            if criteria.use_digits:
+                hint |= _CLASS_DIGIT
+            if criteria.use_symbols:
+                hint |= _CLASS_SYMBOL
+            if len(password) < hint.bit_count():
+                hint = 0
+        
+        return password, hint
+    
+    def generate_pronounceable(self, length: int = 12, fast: bool = False) -> str:
         """
         Génère un mot de passe prononçable (alternance voyelles/consonnes).
         
         Args:
             length: Longueur du mot de passe
+            fast: Tire les lettres avec random.SystemRandom().choices au lieu
+                de secrets
             
         Returns:
             Mot de passe prononçable
         """
-        vowels = "aeiou"
-        consonants = "bcdfghjklmnpqrstvwxyz"
+        vowels = b"aeiou"
+        consonants = b"bcdfghjklmnpqrstvwxyz"
         
-        password = ""
-        for i in range(length):
-            if i % 2 == 0:  # Position paire = consonne
-                password += secrets.choice(consonants)
-            else:  # Position impaire = voyelle
-                password += secrets.choice(vowels)
+        choices = self._sysrand.choices if fast else self._secure_choices
+        
+        # Tout est construit dans un seul tampon d'octets, décodé une fois à la fin
+        # (tirer dans des bytes donne directement des codes d'octets)
+        buffer = bytearray(length)
+        buffer[0::2] = choices(consonants, k=(length + 1) // 2)  # Positions paires = consonnes
+        buffer[1::2] = choices(vowels, k=length // 2)  # Positions impaires = voyelles
         
         # Ajoute quelques chiffres et majuscules pour la sécurité
         if length > 6:
-            # Remplace quelques caractères par des majuscules
-            password = self._add_random_case(password)
+            # Remplace quelques caractères par des majuscules (positions distinctes)
+            for pos in self._sysrand.sample(range(length), length // 3):
+                buffer[pos] ^= 0x20  # Bascule de casse ASCII (bit 0x20) : minuscule -> majuscule
             # Ajoute quelques chiffres
-            password = self._add_random_digits(password, min(2, length // 4))
+            digit_count = min(2, length // 4)
+            digit_positions = self._sysrand.sample(range(length), digit_count)
+            for pos, digit in zip(digit_positions, choices(self.digits, k=digit_count)):
+                buffer[pos] = ord(digit)
+        
+        password = buffer.decode('ascii')
         
         return password
     
@@ -148,17 +356,7 @@ class PasswordGenerator:
         Returns:
             Phrase de passe
         """
-        # Liste de mots courants mais non triviaux
-        words = [
-            "horizon", "cascade", "thunder", "whisper", "crystal", "phoenix", "glacier",
-            "bambou", "tornade", "mystere", "lumiere", "aventure", "courage", "silence",
-            "orange", "violet", "bronze", "argent", "rubine", "saphir", "emeraude",
-            "montagne", "riviere", "foret", "desert", "ocean", "planete", "etoile",
-            "papillon", "libellule", "colibri", "elephant", "panthere", "dolphin",
-            "keyboard", "melody", "rhythm", "harmony", "symphony", "poetry", "canvas"
-        ]
-        
-        selected_words = [secrets.choice(words) for _ in range(word_count)]
+        selected_words = self._secure_choices(PASSPHRASE_WORDS, word_count)
         
         # Ajoute un nombre aléatoire pour plus de sécurité
         selected_words.append(str(secrets.randbelow(9999)))
@@ -176,27 +374,37 @@ class PasswordGenerator:
         Returns:
             Mot de passe modifié si nécessaire
         """
-        pool = self._get_character_pool(criteria)
-        password_list = list(password)
-        
-        # Vérifie et corrige chaque critère
-        if criteria.use_uppercase and not any(c in self.uppercase for c in password):
-            pos = secrets.randbelow(len(password_list))
-            password_list[pos] = secrets.choice(self.uppercase)
-        
-        if criteria.use_lowercase and not any(c in self.lowercase for c in password):
-            pos = secrets.randbelow(len(password_list))
-            password_list[pos] = secrets.choice(self.lowercase)
-        
-        if criteria.use_digits and not any(c in self.digits for c in password):
-            pos = secrets.randbelow(len(password_list))
-            password_list[pos] = secrets.choice(self.digits)
-        
-        if criteria.use_symbols and not any(c in self.symbols for c in password):
-            pos = secrets.randbelow(len(password_list))
-            password_list[pos] = secrets.choice(self.symbols)
-        
-        return ''.join(password_list)
+        # Classes demandées mais absentes
+        missing = [
+            (bit, charset)
+            for enabled, bit, charset_set, charset in (
+                (criteria.use_uppercase, _CLASS_UPPER, self._uppercase_set, self.uppercase),
+                (criteria.use_lowercase, _CLASS_LOWER, self._lowercase_set, self.lowercase),
+                (criteria.use_digits, _CLASS_DIGIT, self._digits_set, self.digits),
+                (criteria.use_symbols, _CLASS_SYMBOL, self._symbols_set, self.symbols),
+            )
+            if enabled and charset_set.isdisjoint(password)
+        ]
+        if not missing:
+            return password
+        
+        # Les caractères tirés du pool sont ASCII : on corrige un tampon d'octets
+        # (affectation indexée en C, sans objet str d'un caractère par position)
+        buffer = bytearray(password, 'ascii')
+        counts = Counter(_CLASS_TBL[code] for code in buffer)
+        
+        # Chaque ajout remplace un caractère d'une classe présente au moins deux
+        # fois : aucune classe déjà présente (ou ajoutée juste avant) ne disparaît
+        for bit, charset in missing:
+            candidates = [pos for pos, code in enumerate(buffer) if counts[_CLASS_TBL[code]] > 1]
+            if not candidates:
+                break  # Mot de passe plus court que le nombre de classes demandées
+            pos = candidates[secrets.randbelow(len(candidates))]
+            counts[_CLASS_TBL[buffer[pos]]] -= 1
+            counts[bit] += 1
+            buffer[pos] = ord(secrets.choice(charset))
+        
+        return buffer.decode('ascii')
     
     def _include_required_chars(self, password: str, criteria: PasswordCriteria) -> str:
         """
@@ -209,43 +417,71 @@ class PasswordGenerator:
         Returns:
             Mot de passe avec caractères requis
         """
+        # Caractères requis absents (sans doublon, dans l'ordre donné)
+        required = dict.fromkeys(criteria.must_include)
+        present = set(password)
+        missing = [char for char in required if char not in present]
+        if not missing:
+            return password
+        
+        # Positions distinctes, prises hors des caractères requis déjà présents :
+        # un ajout n'écrase jamais un autre caractère obligatoire.
+        # Liste plutôt que bytearray : must_include peut contenir des caractères non ASCII
         password_list = list(password)
-        
-        for char in criteria.must_include:
-            if char not in password_list:
-                # Remplace un caractère aléatoire
-                pos = secrets.randbelow(len(password_list))
-                password_list[pos] = char
+        free = [pos for pos, char in enumerate(password_list) if char not in required]
+        positions = self._sysrand.sample(free, min(len(missing), len(free)))
+        for pos, char in zip(positions, missing):
+            password_list[pos] = char
         
         return ''.join(password_list)
+
+
+def _scan_classes(password: str, known: int = 0) -> Tuple[int, int]:
+    """
+    Détermine en un seul parcours les classes présentes et le nombre de caractères uniques.
     
-    def _add_random_case(self, password: str) -> str:
-        """Ajoute des majuscules aléatoires."""
-        password_list = list(password.lower())
-        for _ in range(len(password_list) // 3):
-            pos = secrets.randbelow(len(password_list))
-            if password_list[pos].isalpha():
-                password_list[pos] = password_list[pos].upper()
-        return ''.join(password_list)
+    Args:
+        password: Mot de passe à analyser
+        known: Classes déjà connues comme présentes (masque _CLASS_*)
+        
+    Returns:
+        Tuple (masque des classes _CLASS_*, nombre de caractères uniques)
+    """
+    mask = known
     
-    def _add_random_digits(self, password: str, count: int) -> str:
-        """Ajoute des chiffres aléatoires."""
-        password_list = list(password)
-        for _ in range(count):
-            pos = secrets.randbelow(len(password_list))
-            password_list[pos] = secrets.choice(self.digits)
-        return ''.join(password_list)
+    # Cas courant : texte ASCII (isascii() est immédiat). Les octets servent
+    # directement d'indices dans la table, sans appel à ord() par caractère
+    if password.isascii():
+        distinct = set(password.encode('ascii'))
+        for code in distinct:
+            if mask == _CLASS_ALL:
+                break  # Toutes les classes trouvées, inutile de continuer
+            mask |= _CLASS_TBL[code]
+        return mask, len(distinct)
+    
+    distinct = set(password)
+    for ch in distinct:
+        if mask == _CLASS_ALL:
+            break
+        code = ord(ch)
+        if code < 128:
+            mask |= _CLASS_TBL[code]
+        elif ch.isdecimal():  # Chiffres Unicode, comme \d
+            mask |= _CLASS_DIGIT
+    return mask, len(distinct)
 
 
 class PasswordStrengthAnalyzer:
     """Analyseur de force des mots de passe."""
     
-    def analyze(self, password: str) -> Dict[str, any]:
+    def analyze(self, password: str, hint_classes: Optional[int] = None) -> Dict[str, any]:
         """
         Analyse la force d'un mot de passe.
         
         Args:
             password: Mot de passe à analyser
+            hint_classes: Classes déjà garanties par le générateur
+                (voir PasswordGenerator.generate_random_with_hint), non revérifiées
             
         Returns:
             Dictionnaire avec l'analyse détaillée
@@ -258,51 +494,40 @@ class PasswordStrengthAnalyzer:
         
         # Critères d'évaluation
         length = len(password)
-        has_lower = bool(re.search(r'[a-z]', password))
-        has_upper = bool(re.search(r'[A-Z]', password))
-        has_digit = bool(re.search(r'\d', password))
-        has_symbol = bool(re.search(r'[!@#$%^&*()_+\-=\[\]{}|;:,.<>?]', password))
-        
-        # Calcul du score
-        if length >= 8:
-            score += 1
-        if length >= 12:
-            score += 1
-        if length >= 16:
-            score += 1
-        
-        if has_lower:
-            score += 1
-        if has_upper:
-            score += 1
-        if has_digit:
-            score += 1
-        if has_symbol:
-            score += 1
-        
-        # Vérifications supplémentaires
-        unique_chars = len(set(password))
-        if unique_chars >= length * 0.7:  # 70% de caractères uniques
-            score += 1
-        
-        # Pénalités
-        if re.search(r'(.)\1{2,}', password):  # Répétitions
-            score -= 1
-            feedback.append("Évitez les répétitions de caractères")
-        
-        if re.search(r'(012|123|234|345|456|567|678|789|890)', password):  # Séquences
-            score -= 1
-            feedback.append("Évitez les séquences numériques")
-        
-        if re.search(r'(abc|bcd|cde|def|efg|fgh|ghi|hij|ijk|jkl|klm|lmn|mno|nop|opq|pqr|qrs|rst|stu|tuv|uvw|vwx|wxy|xyz)', password.lower()):
-            score -= 1
-            feedback.append("Évitez les séquences alphabétiques")
-        
-        # Mots de passe courants
-        common_passwords = ['password', 'motdepasse', '12345678', 'qwerty', 'azerty']
-        if password.lower() in common_passwords:
-            score = 0
+        lowered = password.lower()
+        classes, unique_chars = _scan_classes(password, hint_classes or 0)
+        has_lower = bool(classes & _CLASS_LOWER)
+        has_upper = bool(classes & _CLASS_UPPER)
+        has_digit = bool(classes & _CLASS_DIGIT)
+        has_symbol = bool(classes & _CLASS_SYMBOL)
+        
+        # Mots de passe courants : score nul d'office, les autres vérifications
+        # (calcul du score, pénalités) sont inutiles
+        if lowered in _COMMON_PASSWORDS:
             feedback.append("Mot de passe trop courant")
+        else:
+            # Calcul du score : un bit par critère rempli, comptés avec bit_count()
+            # (les classes présentes sont déjà un masque de 4 bits)
+            criteria_met = (
+                (length >= 8)
+                | (length >= 12) << 1
+                | (length >= 16) << 2
+                | (unique_chars >= length * 0.7) << 3  # 70% de caractères uniques
+            )
+            score = criteria_met.bit_count() + classes.bit_count()
+            
+            # Pénalités
+            if _RE_REPEAT.search(password):  # Répétitions
+                score -= 1
+                feedback.append("Évitez les répétitions de caractères")
+            
+            if _RE_NUM_SEQUENCE.search(password):  # Séquences
+                score -= 1
+                feedback.append("Évitez les séquences numériques")
+            
+            if _RE_ALPHA_SEQUENCE.search(lowered):
+                score -= 1
+                feedback.append("Évitez les séquences alphabétiques")
         
         # Recommandations
         if not has_lower:
@@ -348,6 +573,37 @@ class PasswordStrengthAnalyzer:
                 "unique_chars": unique_chars
             }
         }
+    
+    def analyze_batch(self, passwords: List[str]) -> List[Dict[str, any]]:
+        """
+        Analyse une liste de mots de passe (audit d'un fichier exporté, par exemple).
+        
+        Chaque mot de passe distinct n'est analysé qu'une fois : les doublons,
+        fréquents dans ces listes, reçoivent une copie de ce premier résultat
+        (dictionnaires et liste de conseils compris), indépendante des autres.
+        
+        Args:
+            passwords: Mots de passe à analyser
+            
+        Returns:
+            Liste des analyses, dans l'ordre des mots de passe
+        """
+        results = {}
+        analyses = []
+        analyze = self.analyze
+        for password in passwords:
+            result = results.get(password)
+            if result is None:
+                result = results[password] = analyze(password)
+            else:
+                # Copie champ par champ, bien plus légère qu'une nouvelle
+                # analyse ; « details » est absent pour un mot de passe vide
+                result = dict(result)
+                result["feedback"] = list(result["feedback"])
+                if "details" in result:
+                    result["details"] = dict(result["details"])
+            analyses.append(result)
+        return analyses
 
 
 def show_password_tips() -> None:
@@ -374,12 +630,12 @@ def interactive_criteria_setup() -> PasswordCriteria:
         length = int(input("🔢 Longueur [12] : ") or "12")
         length = max(4, min(128, length))  # Limite entre 4 et 128
         
-        use_upper = input("🔤 Majuscules ? [O/n] : ").lower() not in ['n', 'non', 'no']
-        use_lower = input("🔤 Minuscules ? [O/n] : ").lower() not in ['n', 'non', 'no']
-        use_digits = input("🔢 Chiffres ? [O/n] : ").lower() not in ['n', 'non', 'no']
-        use_symbols = input("🔣 Symboles ? [O/n] : ").lower() not in ['n', 'non', 'no']
+        use_upper = input("🔤 Majuscules ? [O/n] : ").strip().lower() not in _NO_ANSWERS
+        use_lower = input("🔤 Minuscules ? [O/n] : ").strip().lower() not in _NO_ANSWERS
+        use_digits = input("🔢 Chiffres ? [O/n] : ").strip().lower() not in _NO_ANSWERS
+        use_symbols = input("🔣 Symboles ? [O/n] : ").strip().lower() not in _NO_ANSWERS
         
-        exclude_ambiguous = input("🚫 Exclure caractères ambigus (0O1lI|) ? [O/n] : ").lower() not in ['n', 'non', 'no']
+        exclude_ambiguous = input("🚫 Exclure caractères ambigus (0O1lI|) ? [O/n] : ").strip().lower() not in _NO_ANSWERS
         
         exclude_chars = input("🚫 Caractères à exclure (optionnel) : ").strip()
         must_include = input("✅ Caractères à inclure (optionnel) : ").strip()
@@ -428,8 +684,8 @@ def main():
             
             elif choice == "1":
                 criteria = PasswordCriteria()  # Critères par défaut
-                password = generator.generate_random(criteria)
-                analysis = analyzer.analyze(password)
+                password, hint = generator.generate_random_with_hint(criteria)
+                analysis = analyzer.analyze(password, hint_classes=hint)
                 
                 print(f"\n🔐 Mot de passe généré :")
                 print(f"📋 {password}")
@@ -472,8 +728,8 @@ def main():
             
             elif choice == "4":
                 criteria = interactive_criteria_setup()
-                password = generator.generate_random(criteria)
-                analysis = analyzer.analyze(password)
+                password, hint = generator.generate_random_with_hint(criteria)
+                analysis = analyzer.analyze(password, hint_classes=hint)
                 
                 print(f"\n🔐 Mot de passe personnalisé :")
                 print(f"📋 {password}")
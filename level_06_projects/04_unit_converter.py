@@ -14,14 +14,245 @@ Auteur: Méthode Markova
 Niveau: 06 - Mini-projets concrets
 """
 
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, Dict, Tuple, Optional
 from dataclasses import dataclass
+from functools import lru_cache
+import importlib.util
 import json
+import sys
+import unicodedata
 
+# Optionnel : conversions par lots vectorisées (convert_many). NumPy n'est
+# importé qu'au premier lot converti, pas au lancement du programme.
+_HAS_NUMPY = importlib.util.find_spec("numpy") is not None
 
-@dataclass
+
+# Noms acceptés pour les unités de température
+_TEMP_UNIT_MAP = {
+    'c': 'celsius', 'celsius': 'celsius', '°c': 'celsius',
+    'f': 'fahrenheit', 'fahrenheit': 'fahrenheit', '°f': 'fahrenheit',
+    'k': 'kelvin', 'kelvin': 'kelvin'
+}
+
+# Conversion directe par paire :
+# résultat = (valeur + décalage avant) * multiplicateur / diviseur + décalage après.
+# Mêmes opérations, dans le même ordre, que le passage par les Celsius
+# (K -> F = ((K - 273,15) * 9 / 5) + 32) : résultats identiques au bit près,
+# points de référence exacts (273,15 K -> 32 °F), sans appel de fonction.
+# Une forme réduite « valeur * a + b » serait plus courte, mais son décalage
+# arrondi décale le résultat (273,15 K -> 31,999999999999943 °F).
+_TEMP_AFFINE = {
+    ('celsius', 'fahrenheit'): (0.0, 9.0, 5.0, 32.0),
+    ('celsius', 'kelvin'): (0.0, 1.0, 1.0, 273.15),
+    ('fahrenheit', 'celsius'): (-32.0, 5.0, 9.0, 0.0),
+    ('fahrenheit', 'kelvin'): (-32.0, 5.0, 9.0, 273.15),
+    ('kelvin', 'celsius'): (-273.15, 1.0, 1.0, 0.0),
+    ('kelvin', 'fahrenheit'): (-273.15, 9.0, 5.0, 32.0),
+}
+
+
+# Unités par catégorie, avec leur facteur vers l'unité de base. Construites une
+# seule fois au chargement du module et partagées (en lecture) par tous les
+# convertisseurs
+_CONVERSIONS = {
+    "longueur": {
+        "name": "Longueur",
+        "base_unit": "mètre",
+        "units": {
+            # Vers mètres
+            "millimètre": 0.001,
+            "mm": 0.001,
+            "centimètre": 0.01,
+            "cm": 0.01,
+            "décimètre": 0.1,
+            "dm": 0.1,
+            "mètre": 1.0,
+            "m": 1.0,
+            "kilomètre": 1000.0,
+            "km": 1000.0,
+            
+            # Unités impériales
+            "pouce": 0.0254,
+            "inch": 0.0254,
+            "in": 0.0254,
+            "pied": 0.3048,
+            "foot": 0.3048,
+            "ft": 0.3048,
+            "yard": 0.9144,
+            "yd": 0.9144,
+            "mile": 1609.344,
+            "mi": 1609.344,
+            
+            # Unités nautiques
+            "mile nautique": 1852.0,
+            "nm": 1852.0,
+        }
+    },
+    
+    "poids": {
+        "name": "Poids/Masse",
+        "base_unit": "kilogramme",
+        "units": {
+            # Vers kilogrammes
+            "milligramme": 0.000001,
+            "mg": 0.000001,
+            "gramme": 0.001,
+            "g": 0.001,
+            "kilogramme": 1.0,
+            "kg": 1.0,
+            "tonne": 1000.0,
+            "t": 1000.0,
+            
+            # Unités impériales
+            "once": 0.0283495,
+            "oz": 0.0283495,
+            "livre": 0.453592,
+            "lb": 0.453592,
+            "lbs": 0.453592,
+            "stone": 6.35029,
+            "st": 6.35029,
+        }
+    },
+    
+    "volume": {
+        "name": "Volume",
+        "base_unit": "litre",
+        "units": {
+            # Vers litres
+            "millilitre": 0.001,
+            "ml": 0.001,
+            "centilitre": 0.01,
+            "cl": 0.01,
+            "décilitre": 0.1,
+            "dl": 0.1,
+            "litre": 1.0,
+            "l": 1.0,
+            
+            # Unités US
+            "once liquide US": 0.0295735,
+            "fl oz": 0.0295735,
+            "tasse US": 0.236588,
+            "cup": 0.236588,
+            "pinte US": 0.946353,
+            "pint": 0.946353,
+            "quart US": 0.946353,
+            "gallon US": 3.78541,
+            "gal": 3.78541,
+            
+            # Unités UK
+            "gallon UK": 4.54609,
+            "gallon imperial": 4.54609,
+        }
+    },
+    
+    "surface": {
+        "name": "Surface",
+        "base_unit": "mètre carré",
+        "units": {
+            # Vers mètres carrés
+            "millimètre carré": 0.000001,
+            "mm²": 0.000001,
+            "centimètre carré": 0.0001,
+            "cm²": 0.0001,
+            "mètre carré": 1.0,
+            "m²": 1.0,
+            "hectare": 10000.0,
+            "ha": 10000.0,
+            "kilomètre carré": 1000000.0,
+            "km²": 1000000.0,
+            
+            # Unités impériales
+            "pouce carré": 0.00064516,
+            "in²": 0.00064516,
+            "pied carré": 0.092903,
+            "ft²": 0.092903,
+            "yard carré": 0.836127,
+            "yd²": 0.836127,
+            "acre": 4046.86,
+            "mile carré": 2589988.11,
+        }
+    },
+    
+    "vitesse": {
+        "name": "Vitesse",
+        "base_unit": "mètre par seconde",
+        "units": {
+            # Vers m/s
+            "mètre par seconde": 1.0,
+            "m/s": 1.0,
+            "kilomètre par heure": 0.277778,
+            "km/h": 0.277778,
+            "kph": 0.277778,
+            "mile par heure": 0.44704,
+            "mph": 0.44704,
+            "nœud": 0.514444,
+            "knot": 0.514444,
+            "kt": 0.514444,
+        }
+    }
+}
+
+# Ligatures que la décomposition Unicode ne sépare pas
+_LIGATURES = str.maketrans({"œ": "oe", "æ": "ae"})
+
+
+def _ascii_fold(name: str) -> str:
+    """
+    Retire accents, ligatures et exposants d'un nom d'unité (« mètre carré » -> « metre carre », « m² » -> « m2 »).
+    
+    Args:
+        name: Nom d'unité déjà replié (casefold)
+        
+    Returns:
+        Équivalent ASCII (les caractères sans équivalent sont supprimés)
+    """
+    decomposed = unicodedata.normalize("NFKD", name.translate(_LIGATURES))
+    return decomposed.encode("ascii", "ignore").decode("ascii")
+
+
+def _build_unit_indexes(conversions: Dict[str, dict]) -> Tuple[Dict[str, Dict[str, str]], Dict[str, Tuple[str, float]]]:
+    """
+    Construit les index de recherche des unités.
+    
+    Args:
+        conversions: Unités par catégorie (structure de _CONVERSIONS)
+        
+    Returns:
+        Tuple (index insensible à la casse par catégorie : nom replié avec
+        str.casefold() -> nom canonique, le premier rencontré l'emportant ; table
+        à plat : nom replié -> (catégorie, facteur), la première catégorie l'emportant)
+    """
+    lower_index = {}
+    unit_table = {}
+    for category, data in conversions.items():
+        units = data["units"]
+        index = lower_index[category] = {}
+        for unit_key in units:
+            # Clés internées : une seule copie de chaque nom, partagée par les deux index
+            index.setdefault(sys.intern(unit_key.casefold()), unit_key)
+        # Alias ASCII des noms accentués (« metre », « noeud », « km2 »...), pour
+        # les claviers sans accents ; ils ne remplacent jamais un nom existant
+        for unit_lower, unit_key in list(index.items()):
+            if not unit_lower.isascii():
+                index.setdefault(sys.intern(_ascii_fold(unit_lower)), unit_key)
+        for unit_lower, unit_key in index.items():
+            unit_table.setdefault(unit_lower, (category, units[unit_key]))
+    return lower_index, unit_table
+
+
+_LOWER_INDEX, _UNIT_TABLE = _build_unit_indexes(_CONVERSIONS)
+
+# Catégories et unités figées en tuples : partagées par tous les appels,
+# sans recréer de liste à chaque affichage de menu
+_CATEGORIES: Tuple[str, ...] = tuple(_CONVERSIONS)
+_UNITS_BY_CATEGORY: Dict[str, Tuple[str, ...]] = {
+    category: tuple(data["units"]) for category, data in _CONVERSIONS.items()
+}
+
+
+@dataclass(slots=True, frozen=True)
 class ConversionResult:
-    """Résultat d'une conversion."""
+    """Résultat d'une conversion (immuable, attributs en slots, sans __dict__)."""
     value: float
     from_unit: str
     to_unit: str
@@ -36,161 +267,31 @@ class UnitConverter:
     
     def __init__(self):
         """Initialise le convertisseur avec toutes les unités."""
-        self.conversions = {
-            "longueur": {
-                "name": "Longueur",
-                "base_unit": "mètre",
-                "units": {
-                    # Vers mètres
-                    "millimètre": 0.001,
-                    "mm": 0.001,
-                    "centimètre": 0.01,
-                    "cm": 0.01,
-                    "décimètre": 0.1,
-                    "dm": 0.1,
-                    "mètre": 1.0,
-                    "m": 1.0,
-                    "kilomètre": 1000.0,
-                    "km": 1000.0,
-                    
-                    # Unités impériales
-                    "pouce": 0.0254,
-                    "inch": 0.0254,
-                    "in": 0.0254,
-                    "pied": 0.3048,
-                    "foot": 0.3048,
-                    "ft": 0.3048,
-                    "yard": 0.9144,
-                    "yd": 0.9144,
-                    "mile": 1609.344,
-                    "mi": 1609.344,
-                    
-                    # Unités nautiques
-                    "mile nautique": 1852.0,
-                    "nm": 1852.0,
-                }
-            },
-            
-            "poids": {
-                "name": "Poids/Masse",
-                "base_unit": "kilogramme",
-                "units": {
-                    # Vers kilogrammes
-                    "milligramme": 0.000001,
-                    "mg": 0.000001,
-                    "gramme": 0.001,
-                    "g": 0.001,
-                    "kilogramme": 1.0,
-                    "kg": 1.0,
-                    "tonne": 1000.0,
-                    "t": 1000.0,
-                    
-                    # Unités impériales
-                    "once": 0.0283495,
-                    "oz": 0.0283495,
-                    "livre": 0.453592,
-                    "lb": 0.453592,
-                    "lbs": 0.453592,
-                    "stone": 6.35029,
-                    "st": 6.35029,
-                }
-            },
-            
-            "volume": {
-                "name": "Volume",
-                "base_unit": "litre",
-                "units": {
-                    # Vers litres
-                    "millilitre": 0.001,
-                    "ml": 0.001,
-                    "centilitre": 0.01,
-                    "cl": 0.01,
-                    "décilitre": 0.1,
-                    "dl": 0.1,
-                    "litre": 1.0,
-                    "l": 1.0,
-                    
-                    # Unités US
-                    "once liquide US": 0.0295735,
-                    "fl oz": 0.0295735,
-                    "tasse US": 0.236588,
-                    "cup": 0.236588,
-                    "pinte US": 0.946353,
-                    "pint": 0.946353,
-                    "quart US": 0.946353,
-                    "gallon US": 3.78541,
-                    "gal": 3.78541,
-                    
-                    # Unités UK
-                    "gallon UK": 4.54609,
-                    "gallon imperial": 4.54609,
-                }
-            },
-            
-            "surface": {
-                "name": "Surface",
-                "base_unit": "mètre carré",
-                "units": {
-                    # Vers mètres carrés
-                    "millimètre carré": 0.000001,
-                    "mm²": 0.000001,
-                    "centimètre carré": 0.0001,
-                    "cm²": 0.0001,
-                    "mètre carré": 1.0,
-                    "m²": 1.0,
-                    "hectare": 10000.0,
-                    "ha": 10000.0,
-                    "kilomètre carré": 1000000.0,
-                    "km²": 1000000.0,
-                    
-                    # Unités impériales
-                    "pouce carré": 0.00064516,
-                    "in²": 0.00064516,
-                    "pied carré": 0.092903,
-                    "ft²": 0.092903,
-                    "yard carré": 0.836127,
-                    "yd²": 0.836127,
-                    "acre": 4046.86,
-                    "mile carré": 2589988.11,
-                }
-            },
-            
-            "vitesse": {
-                "name": "Vitesse",
-                "base_unit": "mètre par seconde",
-                "units": {
-                    # Vers m/s
-                    "mètre par seconde": 1.0,
-                    "m/s": 1.0,
-                    "kilomètre par heure": 0.277778,
-                    "km/h": 0.277778,
-                    "kph": 0.277778,
-                    "mile par heure": 0.44704,
-                    "mph": 0.44704,
-                    "nœud": 0.514444,
-                    "knot": 0.514444,
-                    "kt": 0.514444,
-                }
-            }
-        }
+        self.conversions = _CONVERSIONS
+        self._lower_index = _LOWER_INDEX
+        self._unit_table = _UNIT_TABLE
+        self._categories = _CATEGORIES
+        self._units_by_cat = _UNITS_BY_CATEGORY
+        
+        # Paires d'unités déjà résolues : (source, cible, catégorie demandée)
+        # -> (facteur source, inverse du facteur cible, catégorie)
+        self._factor_cache: Dict[Tuple[str, str, Optional[str]], Tuple[float, float, str]] = {}
     
-    def get_categories(self) -> List[str]:
-        """Retourne la liste des catégories disponibles."""
-        return list(self.conversions.keys())
+    def get_categories(self) -> Tuple[str, ...]:
+        """Retourne les catégories disponibles (tuple partagé, non modifiable)."""
+        return self._categories
     
-    def get_units(self, category: str) -> List[str]:
+    def get_units(self, category: str) -> Tuple[str, ...]:
         """
-        Retourne la liste des unités pour une catégorie.
+        Retourne les unités d'une catégorie.
         
         Args:
             category: Catégorie d'unités
             
         Returns:
-            Liste des unités disponibles
+            Tuple des unités disponibles (vide si la catégorie est inconnue)
         """
-        if category not in self.conversions:
-            return []
-        return list(self.conversions[category]["units"].keys())
+        return self._units_by_cat.get(category, ())
     
     def convert(self, value: float, from_unit: str, to_unit: str, category: str = None) -> ConversionResult:
         """
@@ -205,6 +306,114 @@ class UnitConverter:
         Returns:
             Résultat de la conversion
             
+        Raises:
+            ValueError: Si les unités ne sont pas trouvées ou incompatibles
+        """
+        from_factor, to_inverse, category = self._get_factors(from_unit, to_unit, category)
+        
+        # Conversion via l'unité de base (multiplication par l'inverse précalculé
+        # plutôt que division)
+        base_value = value * from_factor
+        result_value = base_value * to_inverse
+        
+        return ConversionResult(
+            value=result_value,
+            from_unit=from_unit,
+            to_unit=to_unit,
+            category=category
+        )
+    
+    def get_converter(self, from_unit: str, to_unit: str, category: str = None) -> Callable[[float], float]:
+        """
+        Retourne une fonction de conversion dédiée à une paire d'unités.
+        
+        Les unités sont résolues une seule fois ici ; la fonction renvoyée ne fait
+        plus que le calcul, sans aucune recherche dans les tables. Utile dans une
+        boucle qui convertit toujours entre les deux mêmes unités.
+        
+        Args:
+            from_unit: Unité source
+            to_unit: Unité cible
+            category: Catégorie (optionnel, détectée automatiquement)
+            
+        Returns:
+            Fonction valeur -> valeur convertie (mêmes résultats que convert())
+            
+        Raises:
+            ValueError: Si les unités ne sont pas trouvées ou incompatibles
+        """
+        from_factor, to_inverse, _ = self._get_factors(from_unit, to_unit, category)
+        
+        def convert_value(value: float) -> float:
+            return value * from_factor * to_inverse
+        
+        return convert_value
+    
+    def convert_many(self, values, from_unit: str, to_unit: str, category: str = None):
+        """
+        Convertit une série de valeurs (mesures, colonne d'un CSV...) d'une unité à une autre.
+        
+        Les unités ne sont résolues qu'une fois pour tout le lot. Avec NumPy, le
+        calcul se fait en une seule opération sur le tableau ; sinon, une liste
+        est calculée en Python.
+        
+        Args:
+            values: Valeurs à convertir (itérable ou tableau NumPy)
+            from_unit: Unité source
+            to_unit: Unité cible
+            category: Catégorie (optionnel, détectée automatiquement)
+            
+        Returns:
+            Tableau NumPy de float64 si NumPy est installé, sinon liste de valeurs
+            
+        Raises:
+            ValueError: Si les unités ne sont pas trouvées ou incompatibles
+        """
+        from_factor, to_inverse, _ = self._get_factors(from_unit, to_unit, category)
+        
+        if _HAS_NUMPY:
+            import numpy as np
+            # Même ordre d'opérations que convert() : résultats identiques.
+            # La seconde multiplication se fait sur place : un seul tableau alloué
+            result = np.asarray(values, dtype=np.float64) * from_factor
+            result *= to_inverse
+            return result
+        
+        return [value * from_factor * to_inverse for value in values]
+    
+    def _get_factors(self, from_unit: str, to_unit: str, category: Optional[str]) -> Tuple[float, float, str]:
+        """
+        Retourne les facteurs d'une paire d'unités, depuis le cache si possible.
+        
+        La résolution complète (détection, normalisation, validation) n'a lieu
+        qu'au premier appel pour une paire donnée.
+        
+        Args:
+            from_unit: Unité source
+            to_unit: Unité cible
+            category: Catégorie (None pour la détecter)
+            
+        Returns:
+            Tuple (facteur source, inverse du facteur cible, catégorie)
+        """
+        key = (from_unit, to_unit, category)
+        factors = self._factor_cache.get(key)
+        if factors is None:
+            factors = self._factor_cache[key] = self._resolve(from_unit, to_unit, category)
+        return factors
+    
+    def _resolve(self, from_unit: str, to_unit: str, category: Optional[str]) -> Tuple[float, float, str]:
+        """
+        Résout une paire d'unités en facteurs vers l'unité de base.
+        
+        Args:
+            from_unit: Unité source
+            to_unit: Unité cible
+            category: Catégorie (None pour la détecter)
+            
+        Returns:
+            Tuple (facteur source, inverse du facteur cible, catégorie)
+            
         Raises:
             ValueError: Si les unités ne sont pas trouvées ou incompatibles
         """
@@ -219,8 +428,8 @@ class UnitConverter:
         units = category_data["units"]
         
         # Normalise les noms d'unités (insensible à la casse)
-        from_unit_key = self._normalize_unit_name(from_unit, units)
-        to_unit_key = self._normalize_unit_name(to_unit, units)
+        from_unit_key = self._normalize_unit_name(from_unit, category)
+        to_unit_key = self._normalize_unit_name(to_unit, category)
         
         if from_unit_key not in units:
             raise ValueError(f"Unité source inconnue : {from_unit} (catégorie: {category})")
@@ -228,16 +437,17 @@ class UnitConverter:
         if to_unit_key not in units:
             raise ValueError(f"Unité cible inconnue : {to_unit} (catégorie: {category})")
         
-        # Conversion via l'unité de base
-        base_value = value * units[from_unit_key]
-        result_value = base_value / units[to_unit_key]
+        from_factor = units[from_unit_key]
+        to_factor = units[to_unit_key]
         
-        return ConversionResult(
-            value=result_value,
-            from_unit=from_unit,
-            to_unit=to_unit,
-            category=category
-        )
+        # Même unité (ou alias de même facteur) : valeur rendue telle quelle,
+        # alors que value * f * (1 / f) peut différer d'un ulp (3 dm -> 3.0000000000000004)
+        if from_factor == to_factor:
+            return 1.0, 1.0, category
+        
+        # L'inverse est calculé une fois par paire (résultat mis en cache) :
+        # chaque conversion multiplie au lieu de diviser
+        return from_factor, 1.0 / to_factor, category
     
     def _find_category(self, from_unit: str, to_unit: str) -> str:
         """
@@ -253,38 +463,33 @@ class UnitConverter:
         Raises:
             ValueError: Si aucune catégorie commune n'est trouvée
         """
-        for category, data in self.conversions.items():
-            units = data["units"]
-            from_normalized = self._normalize_unit_name(from_unit, units)
-            to_normalized = self._normalize_unit_name(to_unit, units)
-            
-            if from_normalized in units and to_normalized in units:
-                return category
+        # Une consultation de la table à plat par unité, sans parcourir les catégories
+        from_entry = self._unit_table.get(from_unit.casefold())
+        to_entry = self._unit_table.get(to_unit.casefold())
+        
+        if from_entry is not None and to_entry is not None and from_entry[0] == to_entry[0]:
+            return from_entry[0]
         
         raise ValueError(f"Impossible de trouver une catégorie commune pour {from_unit} et {to_unit}")
     
-    def _normalize_unit_name(self, unit_name: str, units_dict: Dict[str, float]) -> str:
+    def _normalize_unit_name(self, unit_name: str, category: str) -> str:
         """
         Normalise le nom d'unité (insensible à la casse).
         
         Args:
             unit_name: Nom de l'unité à normaliser
-            units_dict: Dictionnaire des unités de la catégorie
+            category: Catégorie dans laquelle chercher l'unité
             
         Returns:
             Nom normalisé ou original si non trouvé
         """
         # Recherche exacte d'abord
-        if unit_name in units_dict:
+        if unit_name in self.conversions[category]["units"]:
             return unit_name
         
-        # Recherche insensible à la casse
-        unit_lower = unit_name.lower()
-        for unit_key in units_dict.keys():
-            if unit_key.lower() == unit_lower:
-                return unit_key
-        
-        return unit_name  # Retourne l'original si non trouvé
+        # Recherche insensible à la casse (casefold, comme les clés de l'index) :
+        # une seule consultation
+        return self._lower_index[category].get(unit_name.casefold(), unit_name)
 
 
 class TemperatureConverter:
@@ -336,32 +541,20 @@ class TemperatureConverter:
             Résultat de la conversion
         """
         # Normalise les unités
-        unit_map = {
-            'c': 'celsius', 'celsius': 'celsius', '°c': 'celsius',
-            'f': 'fahrenheit', 'fahrenheit': 'fahrenheit', '°f': 'fahrenheit',
-            'k': 'kelvin', 'kelvin': 'kelvin'
-        }
-        
-        from_norm = unit_map.get(from_unit.lower(), from_unit.lower())
-        to_norm = unit_map.get(to_unit.lower(), to_unit.lower())
-        
-        # Matrice de conversion
-        conversion_map = {
-            ('celsius', 'fahrenheit'): cls.celsius_to_fahrenheit,
-            ('fahrenheit', 'celsius'): cls.fahrenheit_to_celsius,
-            ('celsius', 'kelvin'): cls.celsius_to_kelvin,
-            ('kelvin', 'celsius'): cls.kelvin_to_celsius,
-            ('fahrenheit', 'kelvin'): cls.fahrenheit_to_kelvin,
-            ('kelvin', 'fahrenheit'): cls.kelvin_to_fahrenheit,
-        }
+        from_lower = from_unit.lower()
+        to_lower = to_unit.lower()
+        from_norm = _TEMP_UNIT_MAP.get(from_lower, from_lower)
+        to_norm = _TEMP_UNIT_MAP.get(to_lower, to_lower)
         
         if from_norm == to_norm:
             result_value = value
         else:
-            conversion_func = conversion_map.get((from_norm, to_norm))
-            if not conversion_func:
+            # Coefficients précalculés, sans passer par les fonctions ci-dessus
+            coefficients = _TEMP_AFFINE.get((from_norm, to_norm))
+            if coefficients is None:
                 raise ValueError(f"Conversion impossible : {from_unit} vers {to_unit}")
-            result_value = conversion_func(value)
+            before, mult, div, after = coefficients
+            result_value = (value + before) * mult / div + after
         
         return ConversionResult(
             value=result_value,
@@ -369,18 +562,89 @@ class TemperatureConverter:
             to_unit=to_unit,
             category="température"
         )
+    
+    @classmethod
+    def convert_many(cls, values, from_unit: str, to_unit: str):
+        """
+        Convertit une série de températures en une fois.
+        
+        Args:
+            values: Valeurs à convertir (itérable ou tableau NumPy)
+            from_unit: Unité source (C, F, K)
+            to_unit: Unité cible (C, F, K)
+            
+        Returns:
+            Tableau NumPy de float64 si NumPy est installé, sinon liste de valeurs
+        """
+        from_lower = from_unit.lower()
+        to_lower = to_unit.lower()
+        from_norm = _TEMP_UNIT_MAP.get(from_lower, from_lower)
+        to_norm = _TEMP_UNIT_MAP.get(to_lower, to_lower)
+        
+        if from_norm == to_norm:
+            before, mult, div, after = 0.0, 1.0, 1.0, 0.0
+        else:
+            coefficients = _TEMP_AFFINE.get((from_norm, to_norm))
+            if coefficients is None:
+                raise ValueError(f"Conversion impossible : {from_unit} vers {to_unit}")
+            before, mult, div, after = coefficients
+        
+        if _HAS_NUMPY:
+            import numpy as np
+            # Opérations sur place : un seul tableau alloué pour le résultat
+            result = np.asarray(values, dtype=np.float64) + before
+            result *= mult
+            result /= div
+            result += after
+            return result
+        
+        return [(value + before) * mult / div + after for value in values]
+
+
+@lru_cache(maxsize=None)
+def _render_categories_menu() -> str:
+    """
+    Construit le menu des catégories (une seule fois).
+    
+    Returns:
+        Texte complet du menu, prêt à afficher
+    """
+    lines = ["\n📏 CATÉGORIES DISPONIBLES:", "=" * 40]
+    
+    for i, (category, data) in enumerate(_CONVERSIONS.items(), 1):
+        lines.append(f"{i}. {data['name']} ({category})")
+    
+    lines.append("6. 🌡️  Température")
+    return "\n".join(lines)
 
 
 def display_categories(converter: UnitConverter) -> None:
     """Affiche les catégories disponibles."""
-    print("\n📏 CATÉGORIES DISPONIBLES:")
-    print("=" * 40)
+    print(_render_categories_menu())
+
+
+@lru_cache(maxsize=None)
+def _render_units_table(category: str) -> str:
+    """
+    Construit le tableau des unités d'une catégorie (une seule fois par catégorie).
+    
+    Args:
+        category: Catégorie d'unités (clé de _CONVERSIONS)
+        
+    Returns:
+        Texte complet du tableau, prêt à afficher
+    """
+    category_data = _CONVERSIONS[category]
+    lines = [f"\n📐 UNITÉS - {category_data['name'].upper()}:", "=" * 50]
+    
+    units = _UNITS_BY_CATEGORY[category]
     
-    for i, category in enumerate(converter.get_categories(), 1):
-        name = converter.conversions[category]["name"]
-        print(f"{i}. {name} ({category})")
+    # Affiche en colonnes
+    for i in range(0, len(units), 3):
+        row_units = units[i:i+3]
+        lines.append("  ".join(f"{unit:<15}" for unit in row_units))
     
-    print("6. 🌡️  Température")
+    return "\n".join(lines)
 
 
 def display_units(converter: UnitConverter, category: str) -> None:
@@ -389,16 +653,7 @@ def display_units(converter: UnitConverter, category: str) -> None:
         print(f"❌ Catégorie inconnue : {category}")
         return
     
-    category_data = converter.conversions[category]
-    print(f"\n📐 UNITÉS - {category_data['name'].upper()}:")
-    print("=" * 50)
-    
-    units = list(category_data["units"].keys())
-    
-    # Affiche en colonnes
-    for i in range(0, len(units), 3):
-        row_units = units[i:i+3]
-        print("  ".join(f"{unit:<15}" for unit in row_units))
+    print(_render_units_table(category))
 
 
 def display_temperature_units() -> None:
@@ -410,6 +665,27 @@ def display_temperature_units() -> None:
     print("• Kelvin (K)")
 
 
+def _read_float(prompt: str) -> float:
+    """
+    Demande un nombre jusqu'à obtenir une saisie valide.
+    
+    Une faute de frappe fait reposer la question au lieu d'abandonner la
+    conversion et de renvoyer l'utilisateur au menu.
+    
+    Args:
+        prompt: Question affichée
+        
+    Returns:
+        Nombre saisi
+    """
+    while True:
+        text = input(prompt).strip()
+        try:
+            return float(text)
+        except ValueError:
+            print(f"❌ Nombre invalide : {text!r}, réessayez")
+
+
 def interactive_conversion(converter: UnitConverter, temp_converter: TemperatureConverter) -> None:
     """Interface de conversion interactive."""
     try:
@@ -422,7 +698,7 @@ def interactive_conversion(converter: UnitConverter, temp_converter: Temperature
         if category_choice == "6":  # Température
             display_temperature_units()
             
-            value = float(input("\n🔢 Valeur à convertir : "))
+            value = _read_float("\n🔢 Valeur à convertir : ")
             from_unit = input("📥 Unité source (C/F/K) : ").strip()
             to_unit = input("📤 Unité cible (C/F/K) : ").strip()
             
@@ -433,7 +709,7 @@ def interactive_conversion(converter: UnitConverter, temp_converter: Temperature
             
         else:
             # Catégories standards
-            categories = list(converter.get_categories())
+            categories = converter.get_categories()
             
             try:
                 category_index = int(category_choice) - 1
@@ -448,7 +724,7 @@ def interactive_conversion(converter: UnitConverter, temp_converter: Temperature
             
             display_units(converter, category)
             
-            value = float(input("\n🔢 Valeur à convertir : "))
+            value = _read_float("\n🔢 Valeur à convertir : ")
             from_unit = input("📥 Unité source : ").strip()
             to_unit = input("📤 Unité cible : ").strip()
             
@@ -514,6 +790,19 @@ def quick_conversion_examples() -> None:
             print(f"• Erreur: {value}°{from_unit} → °{to_unit}: {e}")
 
 
+# Menu principal, affiché à chaque tour de boucle en un seul print()
+_MAIN_MENU = "\n".join([
+    "\n🎯 OPTIONS:",
+    "1. 🔄 Convertir des unités",
+    "2. 📋 Voir toutes les catégories",
+    "3. 📐 Voir unités d'une catégorie",
+    "4. 🚀 Exemples de conversions",
+    "5. 🌡️  Conversion de température",
+    "0. 🚪 Quitter",
+    "-" * 50,
+])
+
+
 def main():
     """Fonction principale avec interface interactive."""
     converter = UnitConverter()
@@ -523,14 +812,7 @@ def main():
     print("=" * 60)
     
     while True:
-        print("\n🎯 OPTIONS:")
-        print("1. 🔄 Convertir des unités")
-        print("2. 📋 Voir toutes les catégories")
-        print("3. 📐 Voir unités d'une catégorie")
-        print("4. 🚀 Exemples de conversions")
-        print("5. 🌡️  Conversion de température")
-        print("0. 🚪 Quitter")
-        print("-" * 50)
+        print(_MAIN_MENU)
         
         choice = input("👉 Votre choix : ").strip()
         
@@ -564,7 +846,7 @@ def main():
                 display_temperature_units()
                 
                 try:
-                    value = float(input("\n🔢 Valeur : "))
+                    value = _read_float("\n🔢 Valeur : ")
                     from_unit = input("📥 De (C/F/K) : ").strip()
                     to_unit = input("📤 Vers (C/F/K) : ").strip()
                     
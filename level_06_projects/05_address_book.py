@@ -18,15 +18,150 @@ import sqlite3
 import json
 import csv
 import re
-from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass, asdict
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple
+from dataclasses import dataclass
 from datetime import datetime
 import os
+from itertools import starmap
 
 
-@dataclass
+# Réglages propres à la connexion (appliqués une fois à son ouverture) :
+# - synchronous=NORMAL : moins de fsync par commit, sûr en mode WAL
+# - temp_store, cache_size (64 Mo), mmap_size (256 Mio) : moins d'accès disque
+_PRAGMAS_CONNEXION = """
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA cache_size=-64000;
+PRAGMA mmap_size=268435456;
+"""
+
+# Motifs de validation compilés une fois au chargement du module.
+# \Z (et non $) : « x@y.fr\n » n'est pas accepté comme email valide.
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\Z')
+_PHONE_STRIP_RE = re.compile(r'[^\d+]')
+
+# Index plein texte des colonnes recherchées, tenu à jour par des triggers.
+# Tokenizer trigram : recherche de sous-chaîne littérale (% et _ ne sont pas
+# des jokers), insensible à la casse y compris pour les lettres accentuées,
+# via un index inversé au lieu d'un parcours de toute la table. Il faut au
+# moins 3 caractères pour former un trigramme ; en dessous, la recherche
+# parcourt la table avec la même règle (voir _minuscules).
+_COLONNES_FTS = "nom, prenom, telephone, email, entreprise, ville"
+_FTS_LONGUEUR_MIN = 3
+_SQL_FTS_TABLE = f"""
+    CREATE VIRTUAL TABLE contacts_fts USING fts5(
+        {_COLONNES_FTS},
+        content='contacts', content_rowid='id', tokenize='trigram'
+    )
+"""
+_SQL_FTS_TRIGGERS = (
+    f"""
+    CREATE TRIGGER IF NOT EXISTS contacts_fts_ai AFTER INSERT ON contacts BEGIN
+        INSERT INTO contacts_fts(rowid, {_COLONNES_FTS})
+        VALUES (new.id, new.nom, new.prenom, new.telephone, new.email, new.entreprise, new.ville);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS contacts_fts_ad AFTER DELETE ON contacts BEGIN
+        INSERT INTO contacts_fts(contacts_fts, rowid, {_COLONNES_FTS})
+        VALUES ('delete', old.id, old.nom, old.prenom, old.telephone, old.email, old.entreprise, old.ville);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS contacts_fts_au AFTER UPDATE ON contacts BEGIN
+        INSERT INTO contacts_fts(contacts_fts, rowid, {_COLONNES_FTS})
+        VALUES ('delete', old.id, old.nom, old.prenom, old.telephone, old.email, old.entreprise, old.ville);
+        INSERT INTO contacts_fts(rowid, {_COLONNES_FTS})
+        VALUES (new.id, new.nom, new.prenom, new.telephone, new.email, new.entreprise, new.ville);
+    END
+    """,
+)
+
+# Colonnes d'un contact, dans l'ordre des champs de Contact
+_COLONNES_CONTACT = (
+    "id", "nom", "prenom", "telephone", "email", "adresse", "ville",
+    "code_postal", "pays", "profession", "entreprise", "notes",
+    "date_creation", "date_modification"
+)
+
+# Lecture d'un contact complet : colonnes dans l'ordre de _COLONNES_CONTACT,
+# texte NULL -> "" fait par SQLite (nom et prenom sont NOT NULL), de sorte
+# qu'une ligne se passe telle quelle à Contact(*ligne)
+_SQL_SELECT_CONTACT = """
+    SELECT c.id, c.nom, c.prenom,
+           COALESCE(c.telephone, ''), COALESCE(c.email, ''), COALESCE(c.adresse, ''),
+           COALESCE(c.ville, ''), COALESCE(c.code_postal, ''), COALESCE(c.pays, ''),
+           COALESCE(c.profession, ''), COALESCE(c.entreprise, ''), COALESCE(c.notes, ''),
+           c.date_creation, c.date_modification
+    FROM contacts c"""
+
+# Vue résumée des listings : seulement les colonnes affichées, lues
+# entièrement dans l'index idx_liste_nom, sans accès à la table. Le nom complet
+# est formé côté Python par _nom_complet, comme pour Contact.nom_complet.
+_SQL_RESUME = """
+    SELECT id, prenom, nom, COALESCE(telephone, ''), COALESCE(email, '')
+    FROM contacts
+    ORDER BY nom, prenom, id
+"""
+
+# Une requête de listing figée par clé de tri autorisée : le texte SQL ne
+# varie pas d'un appel à l'autre, la connexion réutilise la requête préparée
+# (« prenom » n'est pas répété quand c'est déjà la clé de tri). L'id départage
+# en dernier les homonymes : ordre de création, stable d'un appel à l'autre.
+_SQL_LISTE = {
+    tri: f"{_SQL_SELECT_CONTACT} ORDER BY {tri}" + ("" if tri == "prenom" else ", prenom") + ", id"
+    for tri in ("nom", "prenom", "date_creation", "date_modification")
+}
+
+# Requête d'insertion partagée par l'ajout unitaire et l'ajout par lot : un
+# texte SQL identique réutilise la requête déjà préparée par la connexion
+_SQL_INSERT_CONTACT = """
+    INSERT INTO contacts (
+        nom, prenom, telephone, email, adresse, ville,
+        code_postal, pays, profession, entreprise, notes
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _valeurs_insertion(contact: "Contact") -> Tuple[str, ...]:
+    """Paramètres de _SQL_INSERT_CONTACT pour un contact."""
+    return (
+        contact.nom, contact.prenom, contact.telephone, contact.email,
+        contact.adresse, contact.ville, contact.code_postal, contact.pays,
+        contact.profession, contact.entreprise, contact.notes
+    )
+
+
+def _nom_complet(prenom: str, nom: str) -> str:
+    """Nom complet affiché : « prénom nom », sans blancs aux extrémités."""
+    return f"{prenom} {nom}".strip()
+
+
+def _minuscules(valeur: Optional[str]) -> Optional[str]:
+    """
+    Fonction SQL minuscules() : str.lower, qui traite aussi les lettres
+    accentuées (le lower() de SQLite ne convertit que l'ASCII).
+    """
+    return valeur.lower() if valeur else valeur
+
+
+def _formater_resume(resume: Tuple[Optional[int], str, str, str]) -> str:
+    """
+    Met en forme une ligne de la liste résumée des contacts.
+    
+    Args:
+        resume: Tuple (id, nom complet, téléphone, email)
+        
+    Returns:
+        Ligne en colonnes alignées sur l'en-tête de lister_contacts_resume
+    """
+    contact_id, nom_complet, telephone, email = resume
+    return f"[{contact_id:3d}] {nom_complet:<25} {telephone:<15} {email}"
+
+
+@dataclass(slots=True)
 class Contact:
-    """Représente un contact avec toutes ses informations."""
+    """Représente un contact avec toutes ses informations (attributs en slots, sans __dict__)."""
     id: Optional[int] = None
     nom: str = ""
     prenom: str = ""
@@ -44,7 +179,11 @@ class Contact:
     
     def nom_complet(self) -> str:
         """Retourne le nom complet."""
-        return f"{self.prenom} {self.nom}".strip()
+        return _nom_complet(self.prenom, self.nom)
+    
+    def resume(self) -> Tuple[Optional[int], str, str, str]:
+        """Retourne la vue résumée (id, nom complet, téléphone, email)."""
+        return (self.id, self.nom_complet(), self.telephone, self.email)
     
     def __str__(self) -> str:
         """Représentation string du contact."""
@@ -62,12 +201,37 @@ class AddressBookDB:
             db_path: Chemin vers le fichier de base de données
         """
         self.db_path = db_path
+        
+        # Une seule connexion pour toute la durée de vie de l'objet : le cache
+        # de pages et celui des requêtes préparées restent chauds d'un appel à
+        # l'autre. isolation_level=None : pas de transaction implicite, une
+        # écriture isolée est validée d'elle-même, les lots passent par un
+        # BEGIN explicite.
+        self._conn = sqlite3.connect(db_path, isolation_level=None)
+        self._conn.executescript(_PRAGMAS_CONNEXION)
+        self._conn.create_function("minuscules", 1, _minuscules, deterministic=True)
+        
         self.init_database()
     
+    def fermer(self) -> None:
+        """Ferme la connexion à la base de données."""
+        self._conn.close()
+    
     def init_database(self) -> None:
         """Initialise la structure de la base de données."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
+        conn = self._conn
+        # WAL : les lectures ne sont plus bloquées par les écritures et les
+        # commits s'ajoutent à un journal séquentiel (fichiers -wal et -shm
+        # créés à côté de la base). Le mode est mémorisé dans le fichier,
+        # une seule fois suffit ; sans objet pour une base en mémoire.
+        if self.db_path != ":memory:":
+            conn.execute("PRAGMA journal_mode=WAL")
+        
+        cursor = conn.cursor()
+        
+        # Schéma et index créés dans une seule transaction
+        with conn:
+            cursor.execute("BEGIN")
             
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS contacts (
@@ -88,18 +252,81 @@ class AddressBookDB:
                 )
             """)
             
-            # Index pour optimiser les recherches
+            # Index pour optimiser les recherches et le tri par nom (homonymes
+            # départagés par id). Il couvre aussi la vue résumée et remplace
+            # les anciens idx_nom_prenom et idx_resume, sans id en 3e position.
             cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_nom_prenom 
-                ON contacts(nom, prenom)
+                CREATE INDEX IF NOT EXISTS idx_liste_nom 
+                ON contacts(nom, prenom, id, telephone, email)
             """)
+            cursor.execute("DROP INDEX IF EXISTS idx_nom_prenom")
+            cursor.execute("DROP INDEX IF EXISTS idx_resume")
             
             cursor.execute("""
                 CREATE INDEX IF NOT EXISTS idx_email 
                 ON contacts(email)
             """)
             
-            conn.commit()
+            # Un index par clé de tri de lister_contacts (« ORDER BY clé, prenom, id ») :
+            # les lignes sont lues dans l'ordre de l'index (qui se termine
+            # toujours par l'id), sans tri temporaire
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_prenom 
+                ON contacts(prenom)
+            """)
+            
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_date_creation 
+                ON contacts(date_creation, prenom)
+            """)
+            
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_date_modification 
+                ON contacts(date_modification, prenom)
+            """)
+            
+            # Index partiels pour les tops des statistiques : le GROUP BY
+            # parcourt l'index déjà trié, sans lire la table ni trier
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_ville_nonvide 
+                ON contacts(ville) WHERE ville != ''
+            """)
+            
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_entreprise_nonvide 
+                ON contacts(entreprise) WHERE entreprise != ''
+            """)
+            
+            self._fts = self._init_recherche_plein_texte(cursor)
+    
+    def _init_recherche_plein_texte(self, cursor: sqlite3.Cursor) -> bool:
+        """
+        Crée l'index plein texte et ses triggers s'ils n'existent pas encore.
+        
+        Args:
+            cursor: Curseur de la transaction d'initialisation
+            
+        Returns:
+            True si l'index est utilisable, False si SQLite n'a pas FTS5
+            (ou pas le tokenizer trigram) : la recherche repasse alors par LIKE
+        """
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'contacts_fts'"
+        )
+        if cursor.fetchone():
+            return True
+        
+        try:
+            cursor.execute(_SQL_FTS_TABLE)
+        except sqlite3.OperationalError:
+            return False
+        
+        for trigger in _SQL_FTS_TRIGGERS:
+            cursor.execute(trigger)
+        
+        # Base existante : indexe les contacts déjà présents
+        cursor.execute("INSERT INTO contacts_fts(contacts_fts) VALUES ('rebuild')")
+        return True
     
     def ajouter_contact(self, contact: Contact) -> int:
         """
@@ -111,23 +338,38 @@ class AddressBookDB:
         Returns:
             ID du contact créé
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
+        conn = self._conn
+        cursor = conn.cursor()
+        
+        cursor.execute(_SQL_INSERT_CONTACT, _valeurs_insertion(contact))
+        
+        return cursor.lastrowid
+    
+    def ajouter_contacts_bulk(self, contacts: Iterable[Contact]) -> int:
+        """
+        Ajoute plusieurs contacts en une seule transaction.
+        
+        À préférer à des appels répétés à ajouter_contact pour un import :
+        un seul commit (donc un seul fsync) pour tout le lot, et la requête
+        n'est préparée qu'une fois par executemany.
+        
+        Args:
+            contacts: Contacts à ajouter
             
-            cursor.execute("""
-                INSERT INTO contacts (
-                    nom, prenom, telephone, email, adresse, ville,
-                    code_postal, pays, profession, entreprise, notes
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                contact.nom, contact.prenom, contact.telephone, contact.email,
-                contact.adresse, contact.ville, contact.code_postal, contact.pays,
-                contact.profession, contact.entreprise, contact.notes
-            ))
-            
-            contact_id = cursor.lastrowid
-            conn.commit()
-            return contact_id
+        Returns:
+            Nombre de contacts ajoutés
+        """
+        conn = self._conn
+        cursor = conn.cursor()
+        
+        with conn:
+            cursor.execute("BEGIN")
+            cursor.executemany(
+                _SQL_INSERT_CONTACT,
+                (_valeurs_insertion(contact) for contact in contacts)
+            )
+        
+        return cursor.rowcount
     
     def modifier_contact(self, contact: Contact) -> bool:
         """
@@ -139,25 +381,23 @@ class AddressBookDB:
         Returns:
             True si le contact a été modifié, False sinon
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                UPDATE contacts SET
-                    nom = ?, prenom = ?, telephone = ?, email = ?,
-                    adresse = ?, ville = ?, code_postal = ?, pays = ?,
-                    profession = ?, entreprise = ?, notes = ?,
-                    date_modification = CURRENT_TIMESTAMP
-                WHERE id = ?
-            """, (
-                contact.nom, contact.prenom, contact.telephone, contact.email,
-                contact.adresse, contact.ville, contact.code_postal, contact.pays,
-                contact.profession, contact.entreprise, contact.notes, contact.id
-            ))
-            
-            success = cursor.rowcount > 0
-            conn.commit()
-            return success
+        conn = self._conn
+        cursor = conn.cursor()
+        
+        cursor.execute("""
+            UPDATE contacts SET
+                nom = ?, prenom = ?, telephone = ?, email = ?,
+                adresse = ?, ville = ?, code_postal = ?, pays = ?,
+                profession = ?, entreprise = ?, notes = ?,
+                date_modification = CURRENT_TIMESTAMP
+            WHERE id = ?
+        """, (
+            contact.nom, contact.prenom, contact.telephone, contact.email,
+            contact.adresse, contact.ville, contact.code_postal, contact.pays,
+            contact.profession, contact.entreprise, contact.notes, contact.id
+        ))
+        
+        return cursor.rowcount > 0
     
     def supprimer_contact(self, contact_id: int) -> bool:
         """
@@ -169,14 +409,12 @@ class AddressBookDB:
         Returns:
             True si le contact a été supprimé, False sinon
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            cursor.execute("DELETE FROM contacts WHERE id = ?", (contact_id,))
-            
-            success = cursor.rowcount > 0
-            conn.commit()
-            return success
+        conn = self._conn
+        cursor = conn.cursor()
+        
+        cursor.execute("DELETE FROM contacts WHERE id = ?", (contact_id,))
+        
+        return cursor.rowcount > 0
     
     def obtenir_contact(self, contact_id: int) -> Optional[Contact]:
         """
@@ -188,39 +426,66 @@ class AddressBookDB:
         Returns:
             Contact trouvé ou None
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            cursor.execute("SELECT * FROM contacts WHERE id = ?", (contact_id,))
-            row = cursor.fetchone()
-            
-            if row:
-                return self._row_to_contact(row)
-            return None
+        conn = self._conn
+        cursor = conn.cursor()
+        
+        cursor.execute(f"{_SQL_SELECT_CONTACT} WHERE c.id = ?", (contact_id,))
+        row = cursor.fetchone()
+        
+        if row:
+            return Contact(*row)
+        return None
+    
+    def compter_contacts(self) -> int:
+        """Retourne le nombre de contacts."""
+        return self._conn.execute("SELECT COUNT(*) FROM contacts").fetchone()[0]
+    
+    def iter_rows(self) -> Iterator[Tuple]:
+        """
+        Parcourt les contacts ligne par ligne, triés par nom, pour l'export.
+        
+        Returns:
+            Itérateur de tuples dans l'ordre de _COLONNES_CONTACT
+        """
+        cursor = self._conn.cursor()
+        cursor.execute(_SQL_LISTE["nom"])
+        yield from cursor
+    
+    def lister_contacts_summary(self) -> List[Tuple[int, str, str, str]]:
+        """
+        Liste les contacts en vue résumée, triés par nom.
+        
+        Returns:
+            Tuples (id, nom complet, téléphone, email), comme Contact.resume
+        """
+        cursor = self._conn.cursor()
+        cursor.execute(_SQL_RESUME)
+        return [
+            (contact_id, _nom_complet(prenom, nom), telephone, email)
+            for contact_id, prenom, nom, telephone, email in cursor
+        ]
     
     def lister_contacts(self, tri: str = "nom") -> List[Contact]:
         """
         Liste tous les contacts.
         
         Args:
-            tri: Champ de tri (nom, prenom, date_creation)
+            tri: Champ de tri (nom, prenom, date_creation, date_modification)
             
         Returns:
             Liste des contacts triés
         """
-        valid_sorts = ["nom", "prenom", "date_creation", "date_modification"]
-        if tri not in valid_sorts:
-            tri = "nom"
+        # Clé inconnue : tri par nom
+        sql = _SQL_LISTE.get(tri, _SQL_LISTE["nom"])
         
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            cursor.execute(f"SELECT * FROM contacts ORDER BY {tri}, prenom")
-            rows = cursor.fetchall()
-            
-            return [self._row_to_contact(row) for row in rows]
+        conn = self._conn
+        cursor = conn.cursor()
+        
+        cursor.execute(sql)
+        
+        # Lignes converties au fil de la lecture du curseur, sans liste
+        # intermédiaire de lignes brutes (fetchall)
+        return list(starmap(Contact, cursor))
     
     def rechercher_contacts(self, terme: str) -> List[Contact]:
         """
@@ -232,21 +497,34 @@ class AddressBookDB:
         Returns:
             Liste des contacts correspondants
         """
-        terme_like = f"%{terme}%"
-        
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                SELECT * FROM contacts 
-                WHERE nom LIKE ? OR prenom LIKE ? OR telephone LIKE ? 
-                   OR email LIKE ? OR entreprise LIKE ? OR ville LIKE ?
-                ORDER BY nom, prenom
-            """, (terme_like, terme_like, terme_like, terme_like, terme_like, terme_like))
-            
-            rows = cursor.fetchall()
-            return [self._row_to_contact(row) for row in rows]
+        conn = self._conn
+        cursor = conn.cursor()
+        
+        if self._fts and len(terme) >= _FTS_LONGUEUR_MIN:
+            # Terme passé comme une seule chaîne entre guillemets : les
+            # caractères spéciaux de la syntaxe FTS5 n'y sont pas interprétés
+            cursor.execute(f"""
+                {_SQL_SELECT_CONTACT}
+                JOIN contacts_fts f ON c.id = f.rowid
+                WHERE contacts_fts MATCH ?
+                ORDER BY c.nom, c.prenom, c.id
+            """, ('"' + terme.replace('"', '""') + '"',))
+            
+            return list(starmap(Contact, cursor))
+        
+        # Terme trop court pour l'index (ou FTS5 indisponible) : parcours
+        # complet, avec la même règle que l'index (sous-chaîne littérale,
+        # casse ignorée) plutôt que LIKE, qui traiterait % et _ comme des
+        # jokers et ne ramènerait pas É à é
+        cursor.execute(f"""
+            {_SQL_SELECT_CONTACT}
+            WHERE instr(minuscules(c.nom), :terme) OR instr(minuscules(c.prenom), :terme)
+               OR instr(minuscules(c.telephone), :terme) OR instr(minuscules(c.email), :terme)
+               OR instr(minuscules(c.entreprise), :terme) OR instr(minuscules(c.ville), :terme)
+            ORDER BY c.nom, c.prenom, c.id
+        """, {"terme": terme.lower()})
+        
+        return list(starmap(Contact, cursor))
     
     def obtenir_statistiques(self) -> Dict[str, any]:
         """
@@ -255,72 +533,48 @@ class AddressBookDB:
         Returns:
             Dictionnaire avec les statistiques
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            # Nombre total de contacts
-            cursor.execute("SELECT COUNT(*) FROM contacts")
-            total = cursor.fetchone()[0]
-            
-            # Contacts avec email
-            cursor.execute("SELECT COUNT(*) FROM contacts WHERE email != ''")
-            avec_email = cursor.fetchone()[0]
-            
-            # Contacts avec téléphone
-            cursor.execute("SELECT COUNT(*) FROM contacts WHERE telephone != ''")
-            avec_telephone = cursor.fetchone()[0]
-            
-            # Villes les plus représentées
-            cursor.execute("""
-                SELECT ville, COUNT(*) as count 
-                FROM contacts 
-                WHERE ville != '' 
-                GROUP BY ville 
-                ORDER BY count DESC 
-                LIMIT 5
-            """)
-            villes_top = cursor.fetchall()
-            
-            # Entreprises les plus représentées
-            cursor.execute("""
-                SELECT entreprise, COUNT(*) as count 
-                FROM contacts 
-                WHERE entreprise != '' 
-                GROUP BY entreprise 
-                ORDER BY count DESC 
-                LIMIT 5
-            """)
-            entreprises_top = cursor.fetchall()
-            
-            return {
-                "total_contacts": total,
-                "avec_email": avec_email,
-                "avec_telephone": avec_telephone,
-                "taux_email": (avec_email / total * 100) if total > 0 else 0,
-                "taux_telephone": (avec_telephone / total * 100) if total > 0 else 0,
-                "villes_top": villes_top,
-                "entreprises_top": entreprises_top
-            }
-    
-    def _row_to_contact(self, row: sqlite3.Row) -> Contact:
-        """Convertit une ligne de base de données en Contact."""
-        return Contact(
-            id=row["id"],
-            nom=row["nom"],
-            prenom=row["prenom"],
-            telephone=row["telephone"] or "",
-            email=row["email"] or "",
-            adresse=row["adresse"] or "",
-            ville=row["ville"] or "",
-            code_postal=row["code_postal"] or "",
-            pays=row["pays"] or "",
-            profession=row["profession"] or "",
-            entreprise=row["entreprise"] or "",
-            notes=row["notes"] or "",
-            date_creation=row["date_creation"],
-            date_modification=row["date_modification"]
-        )
-
+        conn = self._conn
+        cursor = conn.cursor()
+        
+        # Total, contacts avec email et avec téléphone en un seul parcours :
+        # NULLIF(x, '') vaut NULL pour une valeur vide, que COUNT ignore
+        cursor.execute("""
+            SELECT COUNT(*), COUNT(NULLIF(email, '')), COUNT(NULLIF(telephone, ''))
+            FROM contacts
+        """)
+        total, avec_email, avec_telephone = cursor.fetchone()
+        
+        # Villes les plus représentées
+        cursor.execute("""
+            SELECT ville, COUNT(*) as count 
+            FROM contacts 
+            WHERE ville != '' 
+            GROUP BY ville 
+            ORDER BY count DESC 
+            LIMIT 5
+        """)
+        villes_top = cursor.fetchall()
+        
+        # Entreprises les plus représentées
+        cursor.execute("""
+            SELECT entreprise, COUNT(*) as count 
+            FROM contacts 
+            WHERE entreprise != '' 
+            GROUP BY entreprise 
+            ORDER BY count DESC 
+            LIMIT 5
+        """)
+        entreprises_top = cursor.fetchall()
+        
+        return {
+            "total_contacts": total,
+            "avec_email": avec_email,
+            "avec_telephone": avec_telephone,
+            "taux_email": (avec_email / total * 100) if total > 0 else 0,
+            "taux_telephone": (avec_telephone / total * 100) if total > 0 else 0,
+            "villes_top": villes_top,
+            "entreprises_top": entreprises_top
+        }
 
 class AddressBook:
     """Carnet d'adresses principal avec interface utilisateur."""
@@ -342,8 +596,7 @@ class AddressBook:
         if not email:
             return True  # Email optionnel
         
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email) is not None
+        return _EMAIL_RE.match(email) is not None
     
     def valider_telephone(self, telephone: str) -> bool:
         """
@@ -359,7 +612,7 @@ class AddressBook:
             return True  # Téléphone optionnel
         
         # Supprime les espaces et caractères spéciaux pour la validation
-        clean_phone = re.sub(r'[^\d+]', '', telephone)
+        clean_phone = _PHONE_STRIP_RE.sub('', telephone)
         # Accepte les numéros de 8 à 15 chiffres (avec éventuel +)
         return len(clean_phone) >= 8 and len(clean_phone) <= 16
     
@@ -457,7 +710,7 @@ class AddressBook:
             detaille: Affichage détaillé ou résumé
         """
         if not detaille:
-            print(f"[{contact.id:3d}] {contact.nom_complet():<25} {contact.telephone:<15} {contact.email}")
+            print(_formater_resume(contact.resume()))
             return
         
         print(f"\n👤 CONTACT #{contact.id}")
@@ -485,19 +738,25 @@ class AddressBook:
         if contact.date_modification != contact.date_creation:
             print(f"📅 Modifié le      : {contact.date_modification}")
     
-    def lister_contacts_resume(self, contacts: List[Contact]) -> None:
-        """Affiche une liste résumée des contacts."""
-        if not contacts:
+    def lister_contacts_resume(self, resumes: List[Tuple[int, str, str, str]]) -> None:
+        """
+        Affiche une liste résumée des contacts.
+        
+        Args:
+            resumes: Tuples (id, nom complet, téléphone, email), tels que
+                renvoyés par lister_contacts_summary ou Contact.resume
+        """
+        if not resumes:
             print("📭 Aucun contact trouvé")
             return
         
-        print(f"\n📋 {len(contacts)} CONTACT(S) TROUVÉ(S):")
+        print(f"\n📋 {len(resumes)} CONTACT(S) TROUVÉ(S):")
         print("=" * 80)
         print(f"{'ID':>3} {'Nom complet':<25} {'Téléphone':<15} {'Email'}")
         print("-" * 80)
         
-        for contact in contacts:
-            self.afficher_contact(contact, detaille=False)
+        for resume in resumes:
+            print(_formater_resume(resume))
     
     def rechercher_et_afficher(self) -> None:
         """Interface de recherche de contacts."""
@@ -507,7 +766,7 @@ class AddressBook:
             return
         
         contacts = self.db.rechercher_contacts(terme)
-        self.lister_contacts_resume(contacts)
+        self.lister_contacts_resume([contact.resume() for contact in contacts])
         
         if contacts:
             try:
@@ -529,8 +788,10 @@ class AddressBook:
         Args:
             format_export: Format d'export (json, csv)
         """
-        contacts = self.db.lister_contacts()
-        if not contacts:
+        # Les lignes sont écrites au fur et à mesure de la lecture : ni liste
+        # complète en mémoire, ni Contact intermédiaire
+        nb_contacts = self.db.compter_contacts()
+        if not nb_contacts:
             print("❌ Aucun contact à exporter")
             return
         
@@ -540,15 +801,18 @@ class AddressBook:
             if format_export.lower() == "json":
                 filename = f"contacts_export_{timestamp}.json"
                 
-                contacts_data = []
-                for contact in contacts:
-                    contact_dict = asdict(contact)
-                    contacts_data.append(contact_dict)
-                
+                # Même rendu que json.dump(liste, indent=2), objet par objet
                 with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(contacts_data, f, indent=2, ensure_ascii=False)
+                    separateur = "[\n  "
+                    for row in self.db.iter_rows():
+                        f.write(separateur)
+                        f.write(json.dumps(
+                            dict(zip(_COLONNES_CONTACT, row)), indent=2, ensure_ascii=False
+                        ).replace("\n", "\n  "))
+                        separateur = ",\n  "
+                    f.write("\n]")
                 
-                print(f"✅ {len(contacts)} contact(s) exporté(s) vers {filename}")
+                print(f"✅ {nb_contacts} contact(s) exporté(s) vers {filename}")
             
             elif format_export.lower() == "csv":
                 filename = f"contacts_export_{timestamp}.csv"
@@ -564,17 +828,10 @@ class AddressBook:
                     ]
                     writer.writerow(headers)
                     
-                    # Données
-                    for contact in contacts:
-                        row = [
-                            contact.id, contact.nom, contact.prenom, contact.telephone,
-                            contact.email, contact.adresse, contact.ville, contact.code_postal,
-                            contact.pays, contact.profession, contact.entreprise,
-                            contact.notes, contact.date_creation, contact.date_modification
-                        ]
-                        writer.writerow(row)
+                    # Données (boucle faite en C par writerows)
+                    writer.writerows(self.db.iter_rows())
                 
-                print(f"✅ {len(contacts)} contact(s) exporté(s) vers {filename}")
+                print(f"✅ {nb_contacts} contact(s) exporté(s) vers {filename}")
             
             else:
                 print("❌ Format d'export non supporté (json, csv)")
@@ -639,8 +896,7 @@ def main():
                     print("❌ Ajout annulé")
             
             elif choix == "2":
-                contacts = carnet.db.lister_contacts()
-                carnet.lister_contacts_resume(contacts)
+                carnet.lister_contacts_resume(carnet.db.lister_contacts_summary())
             
             elif choix == "3":
                 carnet.rechercher_et_afficher()
@@ -714,6 +970,8 @@ def main():
             break
         except Exception as e:
             print(f"❌ Erreur inattendue : {e}")
+    
+    carnet.db.fermer()
 
 
 if __name__ == "__main__":